@@ -2,14 +2,80 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass, fields
-from typing import Any
+from functools import lru_cache
+from itertools import compress
+from operator import attrgetter, is_not
+from typing import Any, NamedTuple, TypeVar, cast
 
-from madvr_envy.protocol import OptionScalar
-from madvr_envy.state import EnvyState
+from madvr_envy.protocol import (
+    AspectRatioMessage,
+    IncomingSignalInfoMessage,
+    MaskingRatioMessage,
+    Message,
+    OptionMessage,
+    OptionScalar,
+    OutgoingSignalInfoMessage,
+    TemperaturesMessage,
+)
+from madvr_envy.state import EnvyState, _fields_written_by, _sorted_items
 
 
-@dataclass(frozen=True)
+class IncomingSignalView(NamedTuple):
+    """Incoming signal fields as carried on ``EnvySnapshot``."""
+
+    resolution: str
+    frame_rate: str
+    signal_type: str
+    color_space: str
+    bit_depth: str
+    hdr_mode: str
+    colorimetry: str
+    black_levels: str
+    aspect_ratio: str
+
+
+class OutgoingSignalView(NamedTuple):
+    """Outgoing signal fields as carried on ``EnvySnapshot``."""
+
+    resolution: str
+    frame_rate: str
+    signal_type: str
+    color_space: str
+    bit_depth: str
+    hdr_mode: str
+    colorimetry: str
+    black_levels: str
+
+
+class AspectRatioView(NamedTuple):
+    """Detected aspect ratio as carried on ``EnvySnapshot``."""
+
+    resolution: str
+    decimal_ratio: float
+    integer_ratio: int
+    name: str
+
+
+class MaskingRatioView(NamedTuple):
+    """Masking ratio as carried on ``EnvySnapshot``."""
+
+    resolution: str
+    decimal_ratio: float
+    integer_ratio: int
+
+
+class TemperaturesView(NamedTuple):
+    """Core temperature readings as carried on ``EnvySnapshot``."""
+
+    gpu: int
+    hdmi_input: int
+    cpu: int
+    mainboard: int
+
+
+@dataclass(frozen=True, slots=True)
 class EnvySnapshot:
     """Immutable, comparison-friendly view of ``EnvyState``."""
 
@@ -23,12 +89,12 @@ class EnvySnapshot:
     active_profile_index: int | None
     current_menu: str | None
     aspect_ratio_mode: str | None
-    incoming_signal: tuple[str, str, str, str, str, str, str, str, str] | None
-    outgoing_signal: tuple[str, str, str, str, str, str, str, str] | None
-    aspect_ratio: tuple[str, float, int, str] | None
-    masking_ratio: tuple[str, float, int] | None
+    incoming_signal: IncomingSignalView | None
+    outgoing_signal: OutgoingSignalView | None
+    aspect_ratio: AspectRatioView | None
+    masking_ratio: MaskingRatioView | None
     tone_map_enabled: bool | None
-    temperatures: tuple[int, int, int, int] | None
+    temperatures: TemperaturesView | None
 
     settings_pages: tuple[tuple[str, str], ...]
     config_pages: tuple[tuple[str, str], ...]
@@ -52,7 +118,7 @@ class EnvySnapshot:
     settings_upload_count: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StateDelta:
     """One changed field between two snapshots."""
 
@@ -61,7 +127,7 @@ class StateDelta:
     new: object
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AdapterEvent:
     """High-level event for integration consumers."""
 
@@ -69,72 +135,99 @@ class AdapterEvent:
     payload: dict[str, object]
 
 
+_SourceT = TypeVar("_SourceT")
+_ValueT = TypeVar("_ValueT")
+_Projector = Callable[[str, _SourceT, Callable[[_SourceT], _ValueT]], _ValueT]
+
+
+def _project_uncached(name: str, source: _SourceT, build: Callable[[_SourceT], _ValueT]) -> _ValueT:
+    return build(source)
+
+
+class _ProjectionCache:
+    """Reuse derived snapshot values while their source object on ``EnvyState`` is unchanged."""
+
+    __slots__ = ("_entries",)
+
+    def __init__(self) -> None:
+        self._entries: dict[str, tuple[object, object]] = {}
+
+    def project(self, name: str, source: _SourceT, build: Callable[[_SourceT], _ValueT]) -> _ValueT:
+        entry = self._entries.get(name)
+        if entry is not None and entry[0] is source:
+            return cast(_ValueT, entry[1])
+        value = build(source)
+        self._entries[name] = (source, value)
+        return value
+
+
+def _temperatures_view(message: TemperaturesMessage | None) -> TemperaturesView | None:
+    if message is None:
+        return None
+    return TemperaturesView(message.gpu, message.hdmi_input, message.cpu, message.mainboard)
+
+
+def _options_tuple(
+    items: tuple[tuple[str, OptionMessage], ...],
+) -> tuple[tuple[str, str, OptionScalar, OptionScalar], ...]:
+    return tuple((key, msg.option_type, msg.current_value, msg.effective_value) for key, msg in items)
+
+
+def _incoming_signal_view(message: IncomingSignalInfoMessage | None) -> IncomingSignalView | None:
+    if message is None:
+        return None
+    return IncomingSignalView(
+        message.resolution,
+        message.frame_rate,
+        message.signal_type,
+        message.color_space,
+        message.bit_depth,
+        message.hdr_mode,
+        message.colorimetry,
+        message.black_levels,
+        message.aspect_ratio,
+    )
+
+
+def _outgoing_signal_view(message: OutgoingSignalInfoMessage | None) -> OutgoingSignalView | None:
+    if message is None:
+        return None
+    return OutgoingSignalView(
+        message.resolution,
+        message.frame_rate,
+        message.signal_type,
+        message.color_space,
+        message.bit_depth,
+        message.hdr_mode,
+        message.colorimetry,
+        message.black_levels,
+    )
+
+
+def _aspect_ratio_view(message: AspectRatioMessage | None) -> AspectRatioView | None:
+    if message is None:
+        return None
+    return AspectRatioView(message.resolution, message.decimal_ratio, message.integer_ratio, message.name)
+
+
+def _masking_ratio_view(message: MaskingRatioMessage | None) -> MaskingRatioView | None:
+    if message is None:
+        return None
+    return MaskingRatioView(message.resolution, message.decimal_ratio, message.integer_ratio)
+
+
 def snapshot_from_state(state: EnvyState) -> EnvySnapshot:
     """Build an immutable snapshot from runtime state."""
-    temperatures: tuple[int, int, int, int] | None = None
-    if state.temperatures is not None:
-        temperatures = (
-            state.temperatures.gpu,
-            state.temperatures.hdmi_input,
-            state.temperatures.cpu,
-            state.temperatures.mainboard,
-        )
-
-    options = tuple(
-        (key, msg.option_type, msg.current_value, msg.effective_value)
-        for key, msg in sorted(state.options.items(), key=lambda item: item[0])
-    )
+    return _build_snapshot(state, _project_uncached)
 
+
+def _build_snapshot(state: EnvyState, project: _Projector) -> EnvySnapshot:
     inherit_path: str | None = None
     inherit_effective: OptionScalar | None = None
     if state.last_inherit_option is not None:
         inherit_path = state.last_inherit_option.option_id_path
         inherit_effective = state.last_inherit_option.effective_value
 
-    incoming_signal: tuple[str, str, str, str, str, str, str, str, str] | None = None
-    if state.incoming_signal is not None:
-        incoming_signal = (
-            state.incoming_signal.resolution,
-            state.incoming_signal.frame_rate,
-            state.incoming_signal.signal_type,
-            state.incoming_signal.color_space,
-            state.incoming_signal.bit_depth,
-            state.incoming_signal.hdr_mode,
-            state.incoming_signal.colorimetry,
-            state.incoming_signal.black_levels,
-            state.incoming_signal.aspect_ratio,
-        )
-
-    outgoing_signal: tuple[str, str, str, str, str, str, str, str] | None = None
-    if state.outgoing_signal is not None:
-        outgoing_signal = (
-            state.outgoing_signal.resolution,
-            state.outgoing_signal.frame_rate,
-            state.outgoing_signal.signal_type,
-            state.outgoing_signal.color_space,
-            state.outgoing_signal.bit_depth,
-            state.outgoing_signal.hdr_mode,
-            state.outgoing_signal.colorimetry,
-            state.outgoing_signal.black_levels,
-        )
-
-    aspect_ratio: tuple[str, float, int, str] | None = None
-    if state.aspect_ratio is not None:
-        aspect_ratio = (
-            state.aspect_ratio.resolution,
-            state.aspect_ratio.decimal_ratio,
-            state.aspect_ratio.integer_ratio,
-            state.aspect_ratio.name,
-        )
-
-    masking_ratio: tuple[str, float, int] | None = None
-    if state.masking_ratio is not None:
-        masking_ratio = (
-            state.masking_ratio.resolution,
-            state.masking_ratio.decimal_ratio,
-            state.masking_ratio.integer_ratio,
-        )
-
     return EnvySnapshot(
         synced=state.synced,
         version=state.version,
@@ -146,17 +239,17 @@ def snapshot_from_state(state: EnvyState) -> EnvySnapshot:
         active_profile_index=state.active_profile_index,
         current_menu=state.current_menu,
         aspect_ratio_mode=state.aspect_ratio_mode,
-        incoming_signal=incoming_signal,
-        outgoing_signal=outgoing_signal,
-        aspect_ratio=aspect_ratio,
-        masking_ratio=masking_ratio,
+        incoming_signal=project("incoming_signal", state.incoming_signal, _incoming_signal_view),
+        outgoing_signal=project("outgoing_signal", state.outgoing_signal, _outgoing_signal_view),
+        aspect_ratio=project("aspect_ratio", state.aspect_ratio, _aspect_ratio_view),
+        masking_ratio=project("masking_ratio", state.masking_ratio, _masking_ratio_view),
         tone_map_enabled=state.tone_map_enabled,
-        temperatures=temperatures,
-        settings_pages=tuple(sorted(state.settings_pages.items(), key=lambda item: item[0])),
-        config_pages=tuple(sorted(state.config_pages.items(), key=lambda item: item[0])),
-        profile_groups=tuple(sorted(state.profile_groups.items(), key=lambda item: item[0])),
-        profiles=tuple(sorted(state.profiles.items(), key=lambda item: item[0])),
-        options=options,
+        temperatures=project("temperatures", state.temperatures, _temperatures_view),
+        settings_pages=_sorted_items(state.settings_pages),
+        config_pages=_sorted_items(state.config_pages),
+        profile_groups=_sorted_items(state.profile_groups),
+        profiles=_sorted_items(state.profiles),
+        options=project("options", _sorted_items(state.options), _options_tuple),
         last_system_action=state.last_system_action,
         last_button_event=state.last_button_event,
         last_inherit_option_path=inherit_path,
@@ -172,82 +265,154 @@ def snapshot_from_state(state: EnvyState) -> EnvySnapshot:
     )
 
 
+# Public ``EnvyState`` fields, read in one call so direct assignments that bypass change tracking
+# can be spotted by identity.
+_STATE_FIELD_NAMES = tuple(state_field.name for state_field in fields(EnvyState) if state_field.name[0] != "_")
+_read_state_fields = attrgetter(*_STATE_FIELD_NAMES)
+
+
 class EnvyStateAdapter:
     """Track snapshots and expose stable deltas/events for HA coordinators."""
 
     def __init__(self) -> None:
         self._last_snapshot: EnvySnapshot | None = None
+        self._last_state: EnvyState | None = None
+        self._last_revision = -1
+        self._last_values: tuple[Any, ...] = ()
+        self._projections = _ProjectionCache()
 
     @property
     def last_snapshot(self) -> EnvySnapshot | None:
         return self._last_snapshot
 
     def update(self, state: EnvyState) -> tuple[EnvySnapshot, list[StateDelta], list[AdapterEvent]]:
-        snapshot = snapshot_from_state(state)
+        """Snapshot ``state`` and diff it against the previous update.
+
+        Fields written by ``apply`` are taken from ``EnvyState``'s change tracking; fields assigned
+        directly are found by comparing each field's value with the one seen on the previous update.
+        Containers mutated in place outside ``apply`` need ``state.touch()``.
+        """
         previous = self._last_snapshot
+        values = _read_state_fields(state)
+        changed_fields: set[str] | None = None
+        if state is self._last_state:
+            last_values = self._last_values
+            if previous is not None and state.revision == self._last_revision and values == last_values:
+                return previous, [], []
+            changed_fields = state.changed_fields_since(self._last_revision)
+            if changed_fields is not None:
+                changed_fields.update(compress(_STATE_FIELD_NAMES, map(is_not, last_values, values)))
+
+        snapshot = _build_snapshot(state, self._projections.project)
         self._last_snapshot = snapshot
+        self._last_state = state
+        self._last_revision = state.revision
+        self._last_values = values
 
         if previous is None:
             return snapshot, [], []
 
-        deltas = _build_deltas(previous, snapshot)
-        events = _build_events(previous, snapshot)
+        deltas, events = _build_changes(previous, snapshot, changed_fields)
         return snapshot, deltas, events
 
 
-def _build_deltas(previous: EnvySnapshot, current: EnvySnapshot) -> list[StateDelta]:
-    deltas: list[StateDelta] = []
+def _compile_delta_builder() -> Callable[[EnvySnapshot, EnvySnapshot], list[StateDelta]]:
+    """Generate a diff function with one unrolled comparison per snapshot field.
+
+    Like the methods ``dataclasses`` itself generates, the source is built once at import
+    time so the per-update diff runs as straight-line attribute loads instead of a loop.
+    """
+    lines = ["def _build_deltas(previous, current):", "    deltas = []"]
     for field_def in fields(EnvySnapshot):
         name = field_def.name
+        lines.append(f"    old = previous.{name}")
+        lines.append(f"    new = current.{name}")
+        lines.append("    if old is not new and old != new:")
+        lines.append(f"        deltas.append(StateDelta({name!r}, old, new))")
+    lines.append("    return deltas")
+    namespace: dict[str, Any] = {"StateDelta": StateDelta}
+    exec("\n".join(lines), namespace)
+    return cast(Callable[[EnvySnapshot, EnvySnapshot], list[StateDelta]], namespace["_build_deltas"])
+
+
+_build_deltas = _compile_delta_builder()
+
+_SNAPSHOT_FIELD_ORDER = {field_def.name: index for index, field_def in enumerate(fields(EnvySnapshot))}
+
+# Snapshot fields derived from each ``EnvyState`` field, for states that report which fields
+# they changed. State fields absent from the snapshot map to nothing.
+_STATE_SNAPSHOT_FIELDS: dict[str, tuple[str, ...]] = {
+    state_field.name: (state_field.name,) if state_field.name in _SNAPSHOT_FIELD_ORDER else ()
+    for state_field in fields(EnvyState)
+}
+_STATE_SNAPSHOT_FIELDS["last_inherit_option"] = ("last_inherit_option_path", "last_inherit_option_effective")
+
+
+def _build_dirty_deltas(previous: EnvySnapshot, current: EnvySnapshot, changed_fields: set[str]) -> list[StateDelta]:
+    names = sorted(
+        {name for state_field in changed_fields for name in _STATE_SNAPSHOT_FIELDS.get(state_field, ())},
+        key=_SNAPSHOT_FIELD_ORDER.__getitem__,
+    )
+    deltas: list[StateDelta] = []
+    for name in names:
         old_value = getattr(previous, name)
         new_value = getattr(current, name)
-        if old_value != new_value:
-            deltas.append(StateDelta(field=name, old=old_value, new=new_value))
+        if old_value is not new_value and old_value != new_value:
+            deltas.append(StateDelta(name, old_value, new_value))
     return deltas
 
 
-def _counter_event(
-    kind: str,
+# Snapshot fields whose changes also surface as high-level adapter events, mapped to
+# ``(event kind, payload key)``. A ``None`` payload key marks a monotonic counter.
+_EVENT_FIELDS: dict[str, tuple[str, str | None]] = {
+    "last_system_action": ("system_action", "action"),
+    "last_button_event": ("button", "button"),
+    "last_inherit_option_path": ("option_inherited", "path"),
+    "last_uploaded_3dlut": ("lut_uploaded", "filename"),
+    "last_renamed_3dlut": ("lut_renamed", "rename"),
+    "last_deleted_3dlut": ("lut_deleted", "filename"),
+    "last_store_settings": ("settings_stored", "store"),
+    "last_restore_settings": ("settings_restored", "target"),
+    "temporary_reset_count": ("temporary_reset", None),
+    "display_changed_count": ("display_changed", None),
+    "settings_upload_count": ("settings_uploaded", None),
+}
+
+# ``EnvyState`` fields whose changes can surface as adapter events.
+_EVENT_STATE_FIELDS = frozenset(
+    state_field
+    for state_field, snapshot_fields in _STATE_SNAPSHOT_FIELDS.items()
+    if any(name in _EVENT_FIELDS for name in snapshot_fields)
+)
+
+
+@lru_cache(maxsize=128)
+def _message_may_emit_events(message_type: type[Message]) -> bool:
+    """Return whether applying ``message_type`` can produce an adapter event."""
+    written = _fields_written_by(message_type)
+    return written is None or not _EVENT_STATE_FIELDS.isdisjoint(written)
+
+
+def _build_changes(
     previous: EnvySnapshot,
     current: EnvySnapshot,
-    field_name: str,
-) -> AdapterEvent | None:
-    old_value = getattr(previous, field_name)
-    new_value = getattr(current, field_name)
-    if not isinstance(old_value, int) or not isinstance(new_value, int) or new_value <= old_value:
-        return None
-    return AdapterEvent(
-        kind=kind,
-        payload={
-            "count": new_value,
-            "increment": new_value - old_value,
-        },
-    )
-
-
-def _change_event(kind: str, old_value: Any, new_value: Any, payload_key: str = "value") -> AdapterEvent | None:
-    if new_value is None or new_value == old_value:
-        return None
-    return AdapterEvent(kind=kind, payload={payload_key: new_value})
-
-
-def _build_events(previous: EnvySnapshot, current: EnvySnapshot) -> list[AdapterEvent]:
+    changed_fields: set[str] | None = None,
+) -> tuple[list[StateDelta], list[AdapterEvent]]:
+    if changed_fields is None:
+        deltas = _build_deltas(previous, current)
+    else:
+        deltas = _build_dirty_deltas(previous, current, changed_fields)
     events: list[AdapterEvent] = []
-
-    for event in (
-        _counter_event("temporary_reset", previous, current, "temporary_reset_count"),
-        _counter_event("display_changed", previous, current, "display_changed_count"),
-        _counter_event("settings_uploaded", previous, current, "settings_upload_count"),
-        _change_event("system_action", previous.last_system_action, current.last_system_action, "action"),
-        _change_event("button", previous.last_button_event, current.last_button_event, "button"),
-        _change_event("option_inherited", previous.last_inherit_option_path, current.last_inherit_option_path, "path"),
-        _change_event("lut_uploaded", previous.last_uploaded_3dlut, current.last_uploaded_3dlut, "filename"),
-        _change_event("lut_renamed", previous.last_renamed_3dlut, current.last_renamed_3dlut, "rename"),
-        _change_event("lut_deleted", previous.last_deleted_3dlut, current.last_deleted_3dlut, "filename"),
-        _change_event("settings_stored", previous.last_store_settings, current.last_store_settings, "store"),
-        _change_event("settings_restored", previous.last_restore_settings, current.last_restore_settings, "target"),
-    ):
-        if event is not None:
-            events.append(event)
-
-    return events
+    for delta in deltas:
+        event_spec = _EVENT_FIELDS.get(delta.field)
+        if event_spec is None:
+            continue
+        kind, payload_key = event_spec
+        old_value: Any = delta.old
+        new_value: Any = delta.new
+        if payload_key is None:
+            if new_value > old_value:
+                events.append(AdapterEvent(kind=kind, payload={"count": new_value, "increment": new_value - old_value}))
+        elif new_value is not None:
+            events.append(AdapterEvent(kind=kind, payload={payload_key: new_value}))
+    return deltas, events
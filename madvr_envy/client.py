@@ -5,20 +5,19 @@ from __future__ import annotations
 import asyncio
 import logging
 import random
-from collections import deque
+from collections import OrderedDict
 from collections.abc import Awaitable, Callable
 from contextlib import suppress
 from typing import Protocol, TypeVar
 
 from madvr_envy import commands as cmd
 from madvr_envy import exceptions
-from madvr_envy.adapter import AdapterEvent, EnvySnapshot, EnvyStateAdapter, StateDelta
+from madvr_envy.adapter import AdapterEvent, EnvySnapshot, EnvyStateAdapter, StateDelta, _message_may_emit_events
 from madvr_envy.protocol import (
     ConfigPageEndMessage,
     ConfigPageMessage,
     ErrorMessage,
     Message,
-    OkMessage,
     OptionEndMessage,
     OptionMessage,
     ProfileEndMessage,
@@ -78,6 +77,7 @@ class MadvrEnvyClient:
         transport_factory: Callable[[], Transport] | None = None,
         sleep_func: Callable[[float], Awaitable[None]] | None = None,
         random_func: RandomFunc | None = None,
+        keepalive_interval: float | None = None,
     ) -> None:
         self.host = host
         self.port = port
@@ -89,23 +89,34 @@ class MadvrEnvyClient:
         self.reconnect_max_backoff = reconnect_max_backoff
         self.reconnect_jitter = reconnect_jitter
         self.auto_reconnect = auto_reconnect
+        self.keepalive_interval = keepalive_interval
 
         self.logger = logger if logger is not None else logging.getLogger(__name__)
         self.state = EnvyState()
 
-        self._callbacks: set[Callback] = set()
-        self._listen_task: asyncio.Task[None] | None = None
+        # Replaced wholesale on (de)registration so ``_emit`` can iterate without copying.
+        self._callbacks: tuple[Callback, ...] = ()
+        # Library-owned adapter wrappers; they guard user code themselves, so ``_emit`` calls them unguarded.
+        self._adapter_callbacks: tuple[Callback, ...] = ()
+        self._supervisor_task: asyncio.Task[None] | None = None
+        self._keepalive_task: asyncio.Task[None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
         self._sync_event = asyncio.Event()
+        # Mirrors ``_sync_event`` so the per-message check is a single attribute test once synced.
+        self._sync_signalled = False
         self._stopping = False
 
         self._transport_factory = transport_factory or (lambda: TcpTransport(self.host, self.port))
         self._transport: Transport | None = None
+        self._read_available_lines: Callable[[], list[str]] | None = None
 
         self._sleep = sleep_func or asyncio.sleep
         self._random = random_func or random.random
 
         self._command_lock = asyncio.Lock()
-        self._ack_waiters: deque[asyncio.Future[Message]] = deque()
+        self._enum_sinks: dict[type[Message], list[asyncio.Queue[Message]]] = {}
+        # Keyed by future so abandoned waiters can be dropped in O(1); insertion order is ack order.
+        self._ack_waiters: OrderedDict[asyncio.Future[Message], None] = OrderedDict()
 
     @property
     def connected(self) -> bool:
@@ -122,53 +133,86 @@ class MadvrEnvyClient:
         return runtime_snapshot_from_state(self.state, connected=self.connected)
 
     def register_callback(self, callback: Callback) -> None:
-        self._callbacks.add(callback)
+        if callback not in self._callbacks:
+            self._callbacks = (*self._callbacks, callback)
 
     def deregister_callback(self, callback: Callback) -> None:
-        self._callbacks.discard(callback)
+        self._callbacks = tuple(registered for registered in self._callbacks if registered != callback)
+        if callback in self._adapter_callbacks:
+            self.deregister_adapter_callback(callback)
 
     def register_adapter_callback(self, adapter: EnvyStateAdapter, callback: AdapterCallback) -> Callback:
-        """Register a callback that receives adapter snapshots, deltas and events."""
+        """Register a callback that receives adapter snapshots, deltas and events.
 
-        def wrapped(event: str, message: Message | None) -> None:
-            if event != "received_message" or message is None:
+        Messages received within one event loop iteration are coalesced into a single adapter update.
+        Adapter events are derived from the state diff, so the first message and any message that can
+        raise an event (key presses, system actions, counters, ...) are flushed immediately instead.
+        """
+        pending = False
+
+        def flush() -> None:
+            nonlocal pending
+            if not pending:
+                return
+            pending = False
+            if wrapped not in self._adapter_callbacks:
                 return
 
-            initial = adapter.last_snapshot is None
-            snapshot, deltas, events = adapter.update(self.state)
+            try:
+                initial = adapter.last_snapshot is None
+                snapshot, deltas, events = adapter.update(self.state)
 
-            if initial:
-                callback(snapshot, deltas, [AdapterEvent(kind="initial", payload={}), *events])
-                return
+                if initial:
+                    events = [AdapterEvent(kind="initial", payload={}), *events]
+                elif not deltas and not events:
+                    return
 
-            if not deltas and not events:
-                return
+                callback(snapshot, deltas, events)
+            except Exception:
+                self.logger.exception("Adapter callback raised an exception")
 
-            callback(snapshot, deltas, events)
+        def wrapped(event: str, message: Message | None) -> None:
+            nonlocal pending
+            if event != "received_message" or message is None:
+                return
+            if adapter.last_snapshot is None or _message_may_emit_events(type(message)):
+                pending = True
+                flush()
+                return
+            if pending:
+                return
+            pending = True
+            (self._loop or asyncio.get_running_loop()).call_soon(flush)
 
-        self.register_callback(wrapped)
+        self._adapter_callbacks = (*self._adapter_callbacks, wrapped)
         return wrapped
 
     def deregister_adapter_callback(self, callback: Callback) -> None:
         """Deregister a callback previously returned by ``register_adapter_callback``."""
-        self.deregister_callback(callback)
+        self._adapter_callbacks = tuple(registered for registered in self._adapter_callbacks if registered != callback)
 
     async def start(self) -> None:
-        if self._listen_task is not None and not self._listen_task.done():
+        if self._supervisor_task is not None and not self._supervisor_task.done():
             return
 
         self._stopping = False
+        self._loop = asyncio.get_running_loop()
         await self._connect()
-        self._listen_task = asyncio.create_task(self._listen_loop())
+        self._supervisor_task = asyncio.create_task(self._supervise())
+        if self.keepalive_interval is not None and (self._keepalive_task is None or self._keepalive_task.done()):
+            self._keepalive_task = asyncio.create_task(self._keepalive(self.keepalive_interval))
 
     async def stop(self) -> None:
         self._stopping = True
 
-        if self._listen_task is not None:
-            self._listen_task.cancel()
+        for task in (self._keepalive_task, self._supervisor_task):
+            if task is None:
+                continue
+            task.cancel()
             with suppress(asyncio.CancelledError):
-                await self._listen_task
-            self._listen_task = None
+                await task
+        self._keepalive_task = None
+        self._supervisor_task = None
 
         await self._disconnect_statefully()
 
@@ -195,13 +239,13 @@ class MadvrEnvyClient:
         return await self._command(line, wait_for_ack=wait_for_ack, ack_timeout=ack_timeout)
 
     async def heartbeat(self, wait_for_ack: bool = False) -> Message | None:
-        return await self.send_raw(cmd.heartbeat(), wait_for_ack=wait_for_ack)
+        return await self.send_raw(cmd.HEARTBEAT, wait_for_ack=wait_for_ack)
 
     async def bye(self, wait_for_ack: bool = False) -> Message | None:
-        return await self.send_raw(cmd.bye(), wait_for_ack=wait_for_ack)
+        return await self.send_raw(cmd.BYE, wait_for_ack=wait_for_ack)
 
     async def power_off(self, wait_for_ack: bool = True) -> Message | None:
-        return await self.send_raw(cmd.power_off(), wait_for_ack=wait_for_ack)
+        return await self.send_raw(cmd.POWER_OFF, wait_for_ack=wait_for_ack)
 
     async def power_on(self, wait_for_ack: bool = True) -> Message | None:
         """Wake the Envy using its documented POWER command path."""
@@ -212,19 +256,19 @@ class MadvrEnvyClient:
         return await self.power_on(wait_for_ack=wait_for_ack)
 
     async def standby(self, wait_for_ack: bool = True) -> Message | None:
-        return await self.send_raw(cmd.standby(), wait_for_ack=wait_for_ack)
+        return await self.send_raw(cmd.STANDBY, wait_for_ack=wait_for_ack)
 
     async def restart(self, wait_for_ack: bool = True) -> Message | None:
-        return await self.send_raw(cmd.restart(), wait_for_ack=wait_for_ack)
+        return await self.send_raw(cmd.RESTART, wait_for_ack=wait_for_ack)
 
     async def reload_software(self, wait_for_ack: bool = True) -> Message | None:
-        return await self.send_raw(cmd.reload_software(), wait_for_ack=wait_for_ack)
+        return await self.send_raw(cmd.RELOAD_SOFTWARE, wait_for_ack=wait_for_ack)
 
     async def open_menu(self, menu: cmd.MenuName | str, wait_for_ack: bool = True) -> Message | None:
         return await self.send_raw(cmd.open_menu(menu), wait_for_ack=wait_for_ack)
 
     async def close_menu(self, wait_for_ack: bool = True) -> Message | None:
-        return await self.send_raw(cmd.close_menu(), wait_for_ack=wait_for_ack)
+        return await self.send_raw(cmd.CLOSE_MENU, wait_for_ack=wait_for_ack)
 
     async def key_press(self, button: cmd.RemoteButton | str, wait_for_ack: bool = True) -> Message | None:
         return await self.send_raw(cmd.key_press(button), wait_for_ack=wait_for_ack)
@@ -236,22 +280,22 @@ class MadvrEnvyClient:
         return await self.send_raw(cmd.display_message(timeout_seconds, text), wait_for_ack=wait_for_ack)
 
     async def get_incoming_signal_info(self, wait_for_ack: bool = True) -> Message | None:
-        return await self.send_raw(cmd.get_incoming_signal_info(), wait_for_ack=wait_for_ack)
+        return await self.send_raw(cmd.GET_INCOMING_SIGNAL_INFO, wait_for_ack=wait_for_ack)
 
     async def get_outgoing_signal_info(self, wait_for_ack: bool = True) -> Message | None:
-        return await self.send_raw(cmd.get_outgoing_signal_info(), wait_for_ack=wait_for_ack)
+        return await self.send_raw(cmd.GET_OUTGOING_SIGNAL_INFO, wait_for_ack=wait_for_ack)
 
     async def get_aspect_ratio(self, wait_for_ack: bool = True) -> Message | None:
-        return await self.send_raw(cmd.get_aspect_ratio(), wait_for_ack=wait_for_ack)
+        return await self.send_raw(cmd.GET_ASPECT_RATIO, wait_for_ack=wait_for_ack)
 
     async def get_masking_ratio(self, wait_for_ack: bool = True) -> Message | None:
-        return await self.send_raw(cmd.get_masking_ratio(), wait_for_ack=wait_for_ack)
+        return await self.send_raw(cmd.GET_MASKING_RATIO, wait_for_ack=wait_for_ack)
 
     async def get_temperatures(self, wait_for_ack: bool = True) -> Message | None:
-        return await self.send_raw(cmd.get_temperatures(), wait_for_ack=wait_for_ack)
+        return await self.send_raw(cmd.GET_TEMPERATURES, wait_for_ack=wait_for_ack)
 
     async def get_mac_address(self, wait_for_ack: bool = True) -> Message | None:
-        return await self.send_raw(cmd.get_mac_address(), wait_for_ack=wait_for_ack)
+        return await self.send_raw(cmd.GET_MAC_ADDRESS, wait_for_ack=wait_for_ack)
 
     async def set_aspect_ratio_mode(self, mode: cmd.AspectRatioMode | str, wait_for_ack: bool = True) -> Message | None:
         return await self.send_raw(cmd.set_aspect_ratio_mode(mode), wait_for_ack=wait_for_ack)
@@ -267,7 +311,7 @@ class MadvrEnvyClient:
 
     async def enum_profile_groups_collect(self, timeout: float = 3.0) -> list[ProfileGroupMessage]:
         return await self._collect_enumeration(
-            command_line=cmd.enum_profile_groups(),
+            command_line=cmd.ENUM_PROFILE_GROUPS,
             item_type=ProfileGroupMessage,
             end_type=ProfileGroupEndMessage,
             timeout=timeout,
@@ -282,25 +326,25 @@ class MadvrEnvyClient:
         )
 
     async def enum_profile_groups(self, wait_for_ack: bool = True) -> Message | None:
-        return await self.send_raw(cmd.enum_profile_groups(), wait_for_ack=wait_for_ack)
+        return await self.send_raw(cmd.ENUM_PROFILE_GROUPS, wait_for_ack=wait_for_ack)
 
     async def enum_setting_pages(self, wait_for_ack: bool = True) -> Message | None:
-        return await self.send_raw(cmd.enum_setting_pages(), wait_for_ack=wait_for_ack)
+        return await self.send_raw(cmd.ENUM_SETTING_PAGES, wait_for_ack=wait_for_ack)
 
     async def enum_setting_pages_collect(self, timeout: float = 3.0) -> list[SettingPageMessage]:
         return await self._collect_enumeration(
-            command_line=cmd.enum_setting_pages(),
+            command_line=cmd.ENUM_SETTING_PAGES,
             item_type=SettingPageMessage,
             end_type=SettingPageEndMessage,
             timeout=timeout,
         )
 
     async def enum_config_pages(self, wait_for_ack: bool = True) -> Message | None:
-        return await self.send_raw(cmd.enum_config_pages(), wait_for_ack=wait_for_ack)
+        return await self.send_raw(cmd.ENUM_CONFIG_PAGES, wait_for_ack=wait_for_ack)
 
     async def enum_config_pages_collect(self, timeout: float = 3.0) -> list[ConfigPageMessage]:
         return await self._collect_enumeration(
-            command_line=cmd.enum_config_pages(),
+            command_line=cmd.ENUM_CONFIG_PAGES,
             item_type=ConfigPageMessage,
             end_type=ConfigPageEndMessage,
             timeout=timeout,
@@ -327,40 +371,45 @@ class MadvrEnvyClient:
         return await self.send_raw(cmd.toggle_option(option_name), wait_for_ack=wait_for_ack)
 
     async def tone_map_on(self, wait_for_ack: bool = True) -> Message | None:
-        return await self.send_raw(cmd.tone_map_on(), wait_for_ack=wait_for_ack)
+        return await self.send_raw(cmd.TONE_MAP_ON, wait_for_ack=wait_for_ack)
 
     async def tone_map_off(self, wait_for_ack: bool = True) -> Message | None:
-        return await self.send_raw(cmd.tone_map_off(), wait_for_ack=wait_for_ack)
+        return await self.send_raw(cmd.TONE_MAP_OFF, wait_for_ack=wait_for_ack)
 
     async def hotplug(self, wait_for_ack: bool = True) -> Message | None:
-        return await self.send_raw(cmd.hotplug(), wait_for_ack=wait_for_ack)
+        return await self.send_raw(cmd.HOTPLUG, wait_for_ack=wait_for_ack)
 
     async def refresh_license_info(self, wait_for_ack: bool = True) -> Message | None:
-        return await self.send_raw(cmd.refresh_license_info(), wait_for_ack=wait_for_ack)
+        return await self.send_raw(cmd.REFRESH_LICENSE_INFO, wait_for_ack=wait_for_ack)
 
     async def force_1080p60_output(self, wait_for_ack: bool = True) -> Message | None:
-        return await self.send_raw(cmd.force_1080p60_output(), wait_for_ack=wait_for_ack)
+        return await self.send_raw(cmd.FORCE_1080P60_OUTPUT, wait_for_ack=wait_for_ack)
 
     async def _connect(self) -> None:
         if self.connected:
             return
 
         self._sync_event.clear()
+        self._sync_signalled = False
         self.state.reset_runtime_values()
 
         self._transport = self._transport_factory()
+        # Buffered transports may expose already-received lines for batch processing.
+        self._read_available_lines = getattr(self._transport, "read_available_lines", None)
         await self._transport.connect(timeout=self.connect_timeout)
         self._emit("connected", None)
 
     async def _disconnect_statefully(self) -> None:
         transport = self._transport
         self._transport = None
+        self._read_available_lines = None
 
         self._sync_event.clear()
+        self._sync_signalled = False
         self.state.reset_runtime_values()
 
         while self._ack_waiters:
-            waiter = self._ack_waiters.popleft()
+            waiter, _ = self._ack_waiters.popitem(last=False)
             if not waiter.done():
                 waiter.set_exception(exceptions.NotConnectedError())
 
@@ -372,28 +421,67 @@ class MadvrEnvyClient:
 
         self._emit("disconnected", None)
 
-    async def _listen_loop(self) -> None:
+    async def _supervise(self) -> None:
+        """Run the listener and drive reconnects whenever it reports a lost connection."""
         try:
             while not self._stopping:
-                try:
-                    line = await self._read_line()
-                    message = parse_message(line)
-
-                    self.state.apply(message)
-                    self._resolve_ack_waiter(message)
-                    self._emit("received_message", message)
-
-                    if self.state.synced and not self._sync_event.is_set():
-                        self._sync_event.set()
-                except TimeoutError:
-                    continue
-                except (exceptions.NotConnectedError, OSError):
-                    await self._disconnect_statefully()
-                    reconnected = await self._attempt_reconnect_until_success()
-                    if not reconnected:
-                        break
+                await self._listen_until_disconnected()
+                if self._stopping:
+                    break
+                await self._disconnect_statefully()
+                if not await self._attempt_reconnect_until_success():
+                    break
         except asyncio.CancelledError:
             pass
+        finally:
+            # Nothing reconnects once the supervisor is gone, so heartbeats would only hit a dead transport.
+            if self._keepalive_task is not None:
+                self._keepalive_task.cancel()
+
+    async def _listen_until_disconnected(self) -> None:
+        """Process incoming lines until the transport reports the connection is gone."""
+        while not self._stopping:
+            try:
+                line = await self._read_line()
+            except TimeoutError:
+                continue
+            except (exceptions.NotConnectedError, OSError):
+                return
+
+            self._process_line(line)
+
+            read_available_lines = self._read_available_lines
+            if read_available_lines is not None:
+                for buffered_line in read_available_lines():
+                    self._process_line(buffered_line)
+
+    async def _keepalive(self, interval: float) -> None:
+        """Send a heartbeat every ``interval`` seconds while connected to keep the socket warm."""
+        while not self._stopping:
+            await self._sleep(interval)
+            if not self.connected:
+                continue
+            try:
+                # Wait for the ack so the heartbeat's OK takes its own FIFO slot instead of another command's.
+                await self._command(cmd.HEARTBEAT, wait_for_ack=True)
+            except (exceptions.CommandRejectedError, exceptions.NotConnectedError, OSError, TimeoutError):
+                # The listener notices the broken connection and drives the reconnect.
+                self.logger.debug("Keepalive heartbeat failed", exc_info=True)
+
+    def _process_line(self, line: str) -> None:
+        message = parse_message(line)
+
+        self.state.apply(message)
+        if message.is_ack and self._ack_waiters:
+            self._resolve_ack_waiter(message)
+        if self._enum_sinks:
+            self._route_enumeration_message(message)
+        if self._callbacks or self._adapter_callbacks:
+            self._emit("received_message", message)
+
+        if not self._sync_signalled and self.state.synced:
+            self._sync_signalled = True
+            self._sync_event.set()
 
     async def _read_line(self) -> str:
         if self._transport is None:
@@ -401,15 +489,14 @@ class MadvrEnvyClient:
         return await self._transport.read_line(timeout=self.read_timeout)
 
     def _resolve_ack_waiter(self, message: Message) -> None:
-        if not isinstance(message, (OkMessage, ErrorMessage)):
-            return
-        if not self._ack_waiters:
-            return
-
-        waiter = self._ack_waiters.popleft()
+        waiter, _ = self._ack_waiters.popitem(last=False)
         if not waiter.done():
             waiter.set_result(message)
 
+    def _route_enumeration_message(self, message: Message) -> None:
+        for sink in self._enum_sinks.get(type(message), ()):
+            sink.put_nowait(message)
+
     async def _command(
         self,
         line: str,
@@ -420,18 +507,19 @@ class MadvrEnvyClient:
             raise exceptions.NotConnectedError()
 
         waiter: asyncio.Future[Message] | None = None
+        if wait_for_ack:
+            waiter = (self._loop or asyncio.get_running_loop()).create_future()
 
+        # The lock only orders waiter registration with the send so acks stay FIFO.
         async with self._command_lock:
-            if wait_for_ack:
-                loop = asyncio.get_running_loop()
-                waiter = loop.create_future()
-                self._ack_waiters.append(waiter)
+            if waiter is not None:
+                self._ack_waiters[waiter] = None
 
             try:
                 await self._transport.send_line(line, timeout=self.command_timeout)
             except Exception:
-                if waiter is not None and waiter in self._ack_waiters:
-                    self._ack_waiters.remove(waiter)
+                if waiter is not None:
+                    self._ack_waiters.pop(waiter, None)
                 raise
 
         if waiter is None:
@@ -441,8 +529,7 @@ class MadvrEnvyClient:
         try:
             ack_message = await asyncio.wait_for(waiter, timeout=timeout)
         except TimeoutError:
-            if waiter in self._ack_waiters:
-                self._ack_waiters.remove(waiter)
+            self._ack_waiters.pop(waiter, None)
             raise
 
         if isinstance(ack_message, ErrorMessage):
@@ -461,10 +548,10 @@ class MadvrEnvyClient:
                 await self._connect()
                 return True
             except (exceptions.ConnectionFailedError, exceptions.ConnectionTimeoutError):
+                # Jitter adds up to ``reconnect_jitter`` of the capped delay on top of it.
                 capped_delay = min(delay, self.reconnect_max_backoff)
-                jitter_amount = capped_delay * self.reconnect_jitter * self._random()
-                await self._sleep(capped_delay + jitter_amount)
-                delay = min(max(capped_delay * 2, self.reconnect_initial_backoff), self.reconnect_max_backoff)
+                await self._sleep(capped_delay * (1.0 + self.reconnect_jitter * self._random()))
+                delay = min(capped_delay * 2, self.reconnect_max_backoff)
 
         return False
 
@@ -478,13 +565,8 @@ class MadvrEnvyClient:
         queue: asyncio.Queue[Message] = asyncio.Queue()
         items: list[ItemMessageT] = []
 
-        def on_message(event: str, message: Message | None) -> None:
-            if event != "received_message" or message is None:
-                return
-            if isinstance(message, (item_type, end_type)):
-                queue.put_nowait(message)
-
-        self.register_callback(on_message)
+        for message_type in (item_type, end_type):
+            self._enum_sinks.setdefault(message_type, []).append(queue)
         try:
             await self.send_raw(command_line, wait_for_ack=True)
 
@@ -504,10 +586,20 @@ class MadvrEnvyClient:
                 if isinstance(message, item_type):
                     items.append(message)
         finally:
-            self.deregister_callback(on_message)
+            for message_type in (item_type, end_type):
+                sinks = self._enum_sinks[message_type]
+                sinks.remove(queue)
+                if not sinks:
+                    del self._enum_sinks[message_type]
 
     def _emit(self, event: str, message: Message | None) -> None:
-        for callback in tuple(self._callbacks):
+        for adapter_callback in self._adapter_callbacks:
+            adapter_callback(event, message)
+
+        callbacks = self._callbacks
+        if not callbacks:
+            return
+        for callback in callbacks:
             try:
                 callback(event, message)
             except Exception:
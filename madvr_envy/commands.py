@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Literal
+from typing import Final, Literal, get_args
 
 from madvr_envy.protocol import build_command
 
@@ -41,51 +41,81 @@ AspectRatioMode = Literal[
 ]
 OptionValue = str | int | bool
 
+# Command lines that never change are rendered once at import time and exported as constants.
+HEARTBEAT: Final = build_command("Heartbeat")
+BYE: Final = build_command("Bye")
+POWER_OFF: Final = build_command("PowerOff")
+STANDBY: Final = build_command("Standby")
+RESTART: Final = build_command("Restart")
+RELOAD_SOFTWARE: Final = build_command("ReloadSoftware")
+CLOSE_MENU: Final = build_command("CloseMenu")
+CLOSE_ALERT_WINDOW: Final = build_command("CloseAlertWindow")
+DISPLAY_AUDIO_MUTE: Final = build_command("DisplayAudioMute")
+CLOSE_AUDIO_MUTE: Final = build_command("CloseAudioMute")
+GET_INCOMING_SIGNAL_INFO: Final = build_command("GetIncomingSignalInfo")
+GET_OUTGOING_SIGNAL_INFO: Final = build_command("GetOutgoingSignalInfo")
+GET_ASPECT_RATIO: Final = build_command("GetAspectRatio")
+GET_MASKING_RATIO: Final = build_command("GetMaskingRatio")
+GET_TEMPERATURES: Final = build_command("GetTemperatures")
+GET_MAC_ADDRESS: Final = build_command("GetMacAddress")
+ENUM_PROFILE_GROUPS: Final = build_command("EnumProfileGroups")
+ENUM_SETTING_PAGES: Final = build_command("EnumSettingPages")
+ENUM_CONFIG_PAGES: Final = build_command("EnumConfigPages")
+TONE_MAP_ON: Final = build_command("ToneMapOn")
+TONE_MAP_OFF: Final = build_command("ToneMapOff")
+HOTPLUG: Final = build_command("Hotplug")
+REFRESH_LICENSE_INFO: Final = build_command("RefreshLicenseInfo")
+FORCE_1080P60_OUTPUT: Final = build_command("Force1080p60Output")
+_OPEN_MENU_COMMANDS = {menu: build_command("OpenMenu", menu) for menu in get_args(MenuName)}
+_KEY_PRESS_COMMANDS = {button: build_command("KeyPress", button) for button in get_args(RemoteButton)}
+_KEY_HOLD_COMMANDS = {button: build_command("KeyHold", button) for button in get_args(RemoteButton)}
+_ASPECT_RATIO_MODE_COMMANDS = {mode: build_command("SetAspectRatioMode", mode) for mode in get_args(AspectRatioMode)}
+
 
 def _render_option_value(value: OptionValue) -> str | int:
-    if isinstance(value, bool):
+    if type(value) is bool:
         return "YES" if value else "NO"
     return value
 
 
 def heartbeat() -> str:
-    return build_command("Heartbeat")
+    return HEARTBEAT
 
 
 def bye() -> str:
-    return build_command("Bye")
+    return BYE
 
 
 def power_off() -> str:
-    return build_command("PowerOff")
+    return POWER_OFF
 
 
 def standby() -> str:
-    return build_command("Standby")
+    return STANDBY
 
 
 def restart() -> str:
-    return build_command("Restart")
+    return RESTART
 
 
 def reload_software() -> str:
-    return build_command("ReloadSoftware")
+    return RELOAD_SOFTWARE
 
 
 def open_menu(menu: MenuName | str) -> str:
-    return build_command("OpenMenu", menu)
+    return _OPEN_MENU_COMMANDS.get(menu) or build_command("OpenMenu", menu)
 
 
 def close_menu() -> str:
-    return build_command("CloseMenu")
+    return CLOSE_MENU
 
 
 def key_press(button: RemoteButton | str) -> str:
-    return build_command("KeyPress", button)
+    return _KEY_PRESS_COMMANDS.get(button) or build_command("KeyPress", button)
 
 
 def key_hold(button: RemoteButton | str) -> str:
-    return build_command("KeyHold", button)
+    return _KEY_HOLD_COMMANDS.get(button) or build_command("KeyHold", button)
 
 
 def display_alert_window(text: str) -> str:
@@ -93,7 +123,7 @@ def display_alert_window(text: str) -> str:
 
 
 def close_alert_window() -> str:
-    return build_command("CloseAlertWindow")
+    return CLOSE_ALERT_WINDOW
 
 
 def display_message(timeout_seconds: int, text: str) -> str:
@@ -106,39 +136,39 @@ def display_audio_volume(min_value: int, current_value: int, max_value: int, uni
 
 
 def display_audio_mute() -> str:
-    return build_command("DisplayAudioMute")
+    return DISPLAY_AUDIO_MUTE
 
 
 def close_audio_mute() -> str:
-    return build_command("CloseAudioMute")
+    return CLOSE_AUDIO_MUTE
 
 
 def set_aspect_ratio_mode(mode: AspectRatioMode | str) -> str:
-    return build_command("SetAspectRatioMode", mode)
+    return _ASPECT_RATIO_MODE_COMMANDS.get(mode) or build_command("SetAspectRatioMode", mode)
 
 
 def get_incoming_signal_info() -> str:
-    return build_command("GetIncomingSignalInfo")
+    return GET_INCOMING_SIGNAL_INFO
 
 
 def get_outgoing_signal_info() -> str:
-    return build_command("GetOutgoingSignalInfo")
+    return GET_OUTGOING_SIGNAL_INFO
 
 
 def get_aspect_ratio() -> str:
-    return build_command("GetAspectRatio")
+    return GET_ASPECT_RATIO
 
 
 def get_masking_ratio() -> str:
-    return build_command("GetMaskingRatio")
+    return GET_MASKING_RATIO
 
 
 def get_temperatures() -> str:
-    return build_command("GetTemperatures")
+    return GET_TEMPERATURES
 
 
 def get_mac_address() -> str:
-    return build_command("GetMacAddress")
+    return GET_MAC_ADDRESS
 
 
 def create_profile_group(name: str) -> str:
@@ -154,7 +184,7 @@ def delete_profile_group(group_id: str | int) -> str:
 
 
 def enum_profile_groups() -> str:
-    return build_command("EnumProfileGroups")
+    return ENUM_PROFILE_GROUPS
 
 
 def create_profile(profile_group: str | int, name: str) -> str:
@@ -190,11 +220,11 @@ def enum_profiles(profile_group: str | int) -> str:
 
 
 def enum_setting_pages() -> str:
-    return build_command("EnumSettingPages")
+    return ENUM_SETTING_PAGES
 
 
 def enum_config_pages() -> str:
-    return build_command("EnumConfigPages")
+    return ENUM_CONFIG_PAGES
 
 
 def enum_options(page_or_path: str) -> str:
@@ -214,20 +244,20 @@ def toggle_option(option_name: str) -> str:
 
 
 def tone_map_on() -> str:
-    return build_command("ToneMapOn")
+    return TONE_MAP_ON
 
 
 def tone_map_off() -> str:
-    return build_command("ToneMapOff")
+    return TONE_MAP_OFF
 
 
 def hotplug() -> str:
-    return build_command("Hotplug")
+    return HOTPLUG
 
 
 def refresh_license_info() -> str:
-    return build_command("RefreshLicenseInfo")
+    return REFRESH_LICENSE_INFO
 
 
 def force_1080p60_output() -> str:
-    return build_command("Force1080p60Output")
+    return FORCE_1080P60_OUTPUT
@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
-from dataclasses import dataclass
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from operator import attrgetter
 from typing import Any
 
 from madvr_envy.adapter import AdapterEvent, EnvySnapshot, StateDelta
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HABusEvent:
     """Home Assistant event bus payload."""
 
@@ -17,26 +19,92 @@ class HABusEvent:
     event_data: dict[str, object]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HABridgeUpdate:
     """Coordinator update package derived from adapter output."""
 
     coordinator_data: dict[str, Any]
     changed_fields: tuple[str, ...]
     bus_events: tuple[HABusEvent, ...]
+    # Same names as ``changed_fields``, for subscribers that only test membership.
+    changed_fields_set: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "changed_fields_set", frozenset(self.changed_fields))
 
 
 EventEmitter = Callable[[str, dict[str, object]], None]
+BatchEventEmitter = Callable[[Sequence[tuple[str, dict[str, object]]]], None]
+
+
+@lru_cache(maxsize=64)
+def _event_type(kind: str) -> str:
+    # Event kinds are a small closed vocabulary; reuse one string per kind.
+    return f"madvr_envy.{kind}"
+
+
+# ``(is_on, standby)`` -> power state; ``is_on`` wins, then ``standby``, then an explicit ``is_on=False``.
+_POWER_STATES: dict[tuple[bool | None, bool | None], str] = {
+    (True, True): "on",
+    (True, False): "on",
+    (True, None): "on",
+    (False, True): "standby",
+    (None, True): "standby",
+    (False, False): "off",
+    (False, None): "off",
+    (None, False): "unknown",
+    (None, None): "unknown",
+}
 
 
 def _power_state(snapshot: EnvySnapshot) -> str:
-    if snapshot.is_on is True:
-        return "on"
-    if snapshot.standby is True:
-        return "standby"
-    if snapshot.is_on is False:
-        return "off"
-    return "unknown"
+    return _POWER_STATES.get((snapshot.is_on, snapshot.standby), "unknown")
+
+
+def _options_payload(snapshot: EnvySnapshot) -> dict[str, dict[str, object]]:
+    return {
+        key: {
+            "type": option_type,
+            "current": current_value,
+            "effective": effective_value,
+        }
+        for key, option_type, current_value, effective_value in snapshot.options
+    }
+
+
+def _view_payload(name: str) -> Callable[[EnvySnapshot], dict[str, Any] | None]:
+    get_view = attrgetter(name)
+
+    def build(snapshot: EnvySnapshot) -> dict[str, Any] | None:
+        view = get_view(snapshot)
+        return view._asdict() if view is not None else None
+
+    return build
+
+
+def _mapping_payload(name: str) -> Callable[[EnvySnapshot], dict[str, str]]:
+    get_mapping = attrgetter(name)
+    return lambda snapshot: dict(get_mapping(snapshot))
+
+
+# Snapshot field -> (payload key, builder) used to patch a payload with the fields named by adapter deltas.
+_PAYLOAD_PATCHERS: dict[str, tuple[str, Callable[[EnvySnapshot], Any]]] = {
+    snapshot_field.name: (snapshot_field.name, attrgetter(snapshot_field.name)) for snapshot_field in fields(EnvySnapshot)
+}
+_PAYLOAD_PATCHERS.update(
+    {
+        "synced": ("available", attrgetter("synced")),
+        "is_on": ("power_state", _power_state),
+        "standby": ("power_state", _power_state),
+        "options": ("options", _options_payload),
+    }
+)
+_PAYLOAD_PATCHERS.update(
+    {name: (name, _view_payload(name)) for name in ("incoming_signal", "outgoing_signal", "aspect_ratio", "masking_ratio")}
+)
+_PAYLOAD_PATCHERS.update(
+    {name: (name, _mapping_payload(name)) for name in ("settings_pages", "config_pages", "profile_groups", "profiles")}
+)
 
 
 def coordinator_payload(snapshot: EnvySnapshot) -> dict[str, Any]:
@@ -51,68 +119,17 @@ def coordinator_payload(snapshot: EnvySnapshot) -> dict[str, Any]:
         "active_profile_index": snapshot.active_profile_index,
         "current_menu": snapshot.current_menu,
         "aspect_ratio_mode": snapshot.aspect_ratio_mode,
-        "incoming_signal": (
-            {
-                "resolution": snapshot.incoming_signal[0],
-                "frame_rate": snapshot.incoming_signal[1],
-                "signal_type": snapshot.incoming_signal[2],
-                "color_space": snapshot.incoming_signal[3],
-                "bit_depth": snapshot.incoming_signal[4],
-                "hdr_mode": snapshot.incoming_signal[5],
-                "colorimetry": snapshot.incoming_signal[6],
-                "black_levels": snapshot.incoming_signal[7],
-                "aspect_ratio": snapshot.incoming_signal[8],
-            }
-            if snapshot.incoming_signal is not None
-            else None
-        ),
-        "outgoing_signal": (
-            {
-                "resolution": snapshot.outgoing_signal[0],
-                "frame_rate": snapshot.outgoing_signal[1],
-                "signal_type": snapshot.outgoing_signal[2],
-                "color_space": snapshot.outgoing_signal[3],
-                "bit_depth": snapshot.outgoing_signal[4],
-                "hdr_mode": snapshot.outgoing_signal[5],
-                "colorimetry": snapshot.outgoing_signal[6],
-                "black_levels": snapshot.outgoing_signal[7],
-            }
-            if snapshot.outgoing_signal is not None
-            else None
-        ),
-        "aspect_ratio": (
-            {
-                "resolution": snapshot.aspect_ratio[0],
-                "decimal_ratio": snapshot.aspect_ratio[1],
-                "integer_ratio": snapshot.aspect_ratio[2],
-                "name": snapshot.aspect_ratio[3],
-            }
-            if snapshot.aspect_ratio is not None
-            else None
-        ),
-        "masking_ratio": (
-            {
-                "resolution": snapshot.masking_ratio[0],
-                "decimal_ratio": snapshot.masking_ratio[1],
-                "integer_ratio": snapshot.masking_ratio[2],
-            }
-            if snapshot.masking_ratio is not None
-            else None
-        ),
+        "incoming_signal": snapshot.incoming_signal._asdict() if snapshot.incoming_signal is not None else None,
+        "outgoing_signal": snapshot.outgoing_signal._asdict() if snapshot.outgoing_signal is not None else None,
+        "aspect_ratio": snapshot.aspect_ratio._asdict() if snapshot.aspect_ratio is not None else None,
+        "masking_ratio": snapshot.masking_ratio._asdict() if snapshot.masking_ratio is not None else None,
         "tone_map_enabled": snapshot.tone_map_enabled,
         "temperatures": snapshot.temperatures,
         "settings_pages": dict(snapshot.settings_pages),
         "config_pages": dict(snapshot.config_pages),
         "profile_groups": dict(snapshot.profile_groups),
         "profiles": dict(snapshot.profiles),
-        "options": {
-            key: {
-                "type": option_type,
-                "current": current_value,
-                "effective": effective_value,
-            }
-            for key, option_type, current_value, effective_value in snapshot.options
-        },
+        "options": _options_payload(snapshot),
         "last_system_action": snapshot.last_system_action,
         "last_button_event": snapshot.last_button_event,
         "last_inherit_option_path": snapshot.last_inherit_option_path,
@@ -130,15 +147,9 @@ def coordinator_payload(snapshot: EnvySnapshot) -> dict[str, Any]:
 
 def to_ha_events(events: list[AdapterEvent]) -> tuple[HABusEvent, ...]:
     """Map adapter events to HA event bus objects."""
-    mapped: list[HABusEvent] = []
-    for event in events:
-        mapped.append(
-            HABusEvent(
-                event_type=f"madvr_envy.{event.kind}",
-                event_data=dict(event.payload),
-            )
-        )
-    return tuple(mapped)
+    if not events:
+        return ()
+    return tuple(HABusEvent(_event_type(event.kind), dict(event.payload)) for event in events)
 
 
 def build_bridge_update(
@@ -154,11 +165,37 @@ def build_bridge_update(
     )
 
 
+def _patch_payload(payload: dict[str, Any], snapshot: EnvySnapshot, deltas: list[StateDelta]) -> None:
+    for delta in deltas:
+        key, build = _PAYLOAD_PATCHERS[delta.field]
+        payload[key] = build(snapshot)
+
+
 class HABridgeDispatcher:
-    """Runtime helper that converts adapter updates and dispatches bus events."""
+    """Runtime helper that converts adapter updates and dispatches bus events.
 
-    def __init__(self, event_emitter: EventEmitter | None = None) -> None:
+    Updates are expected in order from one adapter: after a full payload is built for the first
+    update (or one carrying an ``initial`` event), the dispatcher patches a private payload with only
+    the fields named by ``deltas``. Each update gets its own top-level copy of that payload, while
+    unchanged nested values are shared between updates, so ``coordinator_data`` should be treated as
+    read-only. Updates with neither deltas nor events reuse the previous update when it carried no
+    changes either.
+
+    A ``batch_emitter`` receives all ``(event_type, event_data)`` pairs of one update in a single
+    call and takes precedence over ``event_emitter``.
+    """
+
+    __slots__ = ("_batch_emitter", "_event_emitter", "_payload", "last_update")
+
+    def __init__(
+        self,
+        event_emitter: EventEmitter | None = None,
+        *,
+        batch_emitter: BatchEventEmitter | None = None,
+    ) -> None:
         self._event_emitter = event_emitter
+        self._batch_emitter = batch_emitter
+        self._payload: dict[str, Any] = {}
         self.last_update: HABridgeUpdate | None = None
 
     def handle_adapter_update(
@@ -167,11 +204,35 @@ class HABridgeDispatcher:
         deltas: list[StateDelta],
         events: list[AdapterEvent],
     ) -> HABridgeUpdate:
-        update = build_bridge_update(snapshot, deltas, events)
+        previous = self.last_update
+        if previous is None or any(event.kind == "initial" for event in events):
+            self._payload = coordinator_payload(snapshot)
+        elif not deltas and not events:
+            # Idle tick: nothing to patch or emit, so keep returning one update without changes.
+            if previous.changed_fields or previous.bus_events:
+                previous = self.last_update = HABridgeUpdate(self._payload.copy(), (), ())
+            return previous
+        else:
+            _patch_payload(self._payload, snapshot, deltas)
+        update = HABridgeUpdate(
+            coordinator_data=self._payload.copy(),
+            changed_fields=tuple(delta.field for delta in deltas),
+            bus_events=to_ha_events(events),
+        )
         self.last_update = update
 
-        if self._event_emitter is not None:
-            for event in update.bus_events:
-                self._event_emitter(event.event_type, event.event_data)
+        bus_events = update.bus_events
+        if not bus_events:
+            return update
+
+        emit_batch = self._batch_emitter
+        if emit_batch is not None:
+            emit_batch([(event.event_type, event.event_data) for event in bus_events])
+            return update
+
+        emit = self._event_emitter
+        if emit is not None:
+            for event in bus_events:
+                emit(event.event_type, event.event_data)
 
         return update
@@ -2,14 +2,13 @@
 
 from __future__ import annotations
 
-import re
 from collections.abc import Awaitable, Callable, Iterable, Mapping
 from dataclasses import dataclass
 from enum import StrEnum
+from functools import lru_cache
+from operator import itemgetter
 from typing import Any
 
-_PROFILE_ID_RE = re.compile(r"^(?P<group>.+?)[_:](?P<index>\d+)$")
-
 
 class EnvyAction(StrEnum):
     """Named action commands supported by the integration."""
@@ -23,15 +22,12 @@ class EnvyAction(StrEnum):
     TONE_MAP_OFF = "tone_map_off"
 
 
-ACTION_METHODS: dict[EnvyAction, str] = {
-    EnvyAction.STANDBY: "standby",
-    EnvyAction.POWER_OFF: "power_off",
-    EnvyAction.HOTPLUG: "hotplug",
-    EnvyAction.RESTART: "restart",
-    EnvyAction.RELOAD_SOFTWARE: "reload_software",
-    EnvyAction.TONE_MAP_ON: "tone_map_on",
-    EnvyAction.TONE_MAP_OFF: "tone_map_off",
-}
+# Client command methods are named after their action values.
+ACTION_METHODS: dict[EnvyAction, str] = {action: action.value for action in EnvyAction}
+
+
+_ACTION_NAMES = tuple(sorted(action.value for action in EnvyAction))
+_ACTION_LOOKUP: dict[str, EnvyAction] = {action.value: action for action in EnvyAction}
 
 
 @dataclass(frozen=True, slots=True)
@@ -53,25 +49,30 @@ class RemoteOperation:
 
 def action_names() -> tuple[str, ...]:
     """Return sorted action names for validation/selectors."""
-    return tuple(sorted(action.value for action in EnvyAction))
+    return _ACTION_NAMES
 
 
 def normalize_action(action: str) -> EnvyAction:
     """Parse and validate action string."""
-    return EnvyAction(action.strip().lower())
+    matched = _ACTION_LOOKUP.get(action)
+    if matched is not None:
+        return matched
+    normalized = action.strip().lower()
+    matched = _ACTION_LOOKUP.get(normalized)
+    if matched is not None:
+        return matched
+    # Unknown action: let the enum raise its usual ``ValueError``.
+    return EnvyAction(normalized)
 
 
 def resolve_action_method(client: Any, action: str | EnvyAction) -> Callable[[], Awaitable[Any]]:
     """Resolve one action to a bound client command method."""
-    action_name = normalize_action(action.value if isinstance(action, EnvyAction) else action)
-    method_name = ACTION_METHODS[action_name]
-    method = getattr(client, method_name)
-    return method
+    return getattr(client, normalize_action(action).value)
 
 
 def iter_remote_operations(command: str | Iterable[object]) -> tuple[RemoteOperation, ...]:
     """Normalize remote command payloads to key/action operations."""
-    raw_values = [command] if isinstance(command, str) else list(command)
+    raw_values = (command,) if isinstance(command, str) else command
     ops: list[RemoteOperation] = []
     for raw in raw_values:
         if not isinstance(raw, str):
@@ -79,8 +80,9 @@ def iter_remote_operations(command: str | Iterable[object]) -> tuple[RemoteOpera
         token = raw.strip()
         if not token:
             continue
-        if token.startswith("action:"):
-            action = token.split(":", 1)[1].strip()
+        prefix, separator, action = token.partition(":")
+        if separator and prefix == "action":
+            action = action.strip()
             if not action:
                 continue
             ops.append(RemoteOperation(kind="action", value=action))
@@ -89,11 +91,22 @@ def iter_remote_operations(command: str | Iterable[object]) -> tuple[RemoteOpera
     return tuple(ops)
 
 
+@lru_cache(maxsize=1024)
+def _split_profile_id(profile_id: str) -> tuple[str, int] | None:
+    # ``<group>_<index>`` or ``<group>:<index>``: digits cannot contain a separator, so only the last one can match.
+    separator = max(profile_id.rfind("_"), profile_id.rfind(":"))
+    if separator > 0:
+        index = profile_id[separator + 1 :]
+        if index.isdecimal():
+            return profile_id[:separator], int(index)
+    return None
+
+
 def parse_profile_id(profile_id: str, fallback_group: object) -> tuple[str, int] | None:
     """Parse profile identifier into group/index."""
-    matched = _PROFILE_ID_RE.match(profile_id)
-    if matched is not None:
-        return matched.group("group"), int(matched.group("index"))
+    parsed = _split_profile_id(profile_id)
+    if parsed is not None:
+        return parsed
 
     if profile_id.isdigit() and isinstance(fallback_group, str):
         return fallback_group, int(profile_id)
@@ -114,25 +127,21 @@ def build_profile_options(data: Mapping[str, object]) -> list[ProfileOption]:
     if not isinstance(raw_profiles, Mapping):
         return []
 
-    options: list[ProfileOption] = []
+    fallback_group = data.get("active_profile_group")
+    group_label = group_names.get
+    # Decorate each option with its sort key once; ``itemgetter(0)`` keeps the sort stable on ties.
+    decorated: list[tuple[str, ProfileOption]] = []
     for profile_id, profile_name in raw_profiles.items():
         if not isinstance(profile_id, str) or not isinstance(profile_name, str):
             continue
 
-        parsed = parse_profile_id(profile_id, data.get("active_profile_group"))
+        parsed = parse_profile_id(profile_id, fallback_group)
         if parsed is None:
             continue
         group_id, index = parsed
 
-        group_label = group_names.get(group_id, group_id)
-
-        options.append(
-            ProfileOption(
-                option=f"{group_label}: {profile_name}",
-                group_id=group_id,
-                profile_index=index,
-            )
-        )
+        option = f"{group_label(group_id, group_id)}: {profile_name}"
+        decorated.append((option.casefold(), ProfileOption(option=option, group_id=group_id, profile_index=index)))
 
-    options.sort(key=lambda option: option.option.casefold())
-    return options
+    decorated.sort(key=itemgetter(0))
+    return [option for _, option in decorated]
@@ -3,143 +3,151 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Callable
 from dataclasses import dataclass
+from functools import lru_cache, partial
+from sys import intern
+from typing import ClassVar
 
 OptionScalar = str | int | float | bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Message:
     """Base protocol message."""
 
+    is_ack: ClassVar[bool] = False
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class WelcomeMessage(Message):
     version: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OkMessage(Message):
-    pass
+    is_ack: ClassVar[bool] = True
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ErrorMessage(Message):
+    is_ack: ClassVar[bool] = True
+
     error: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StandbyMessage(Message):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PowerOffMessage(Message):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RestartMessage(Message):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReloadSoftwareMessage(Message):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NoSignalMessage(Message):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OpenMenuMessage(Message):
     menu: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CloseMenuMessage(Message):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class KeyPressMessage(Message):
     button: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class KeyHoldMessage(Message):
     button: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SetAspectRatioModeMessage(Message):
     mode: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ActivateProfileMessage(Message):
     profile_group: str
     profile_index: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ActiveProfileMessage(Message):
     profile_group: str
     profile_index: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CreateProfileGroupMessage(Message):
     group_id: str
     name: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RenameProfileGroupMessage(Message):
     group_id: str
     name: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DeleteProfileGroupMessage(Message):
     group_id: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CreateProfileMessage(Message):
     profile_group: str
     profile_index: int
     name: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RenameProfileMessage(Message):
     profile_group: str
     profile_index: int
     name: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DeleteProfileMessage(Message):
     profile_group: str
     profile_index: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AddProfileToPageMessage(Message):
     profile_id: str
     page_id: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RemoveProfileFromPageMessage(Message):
     profile_id: str
     page_id: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IncomingSignalInfoMessage(Message):
     resolution: str
     frame_rate: str
@@ -152,7 +160,7 @@ class IncomingSignalInfoMessage(Message):
     aspect_ratio: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OutgoingSignalInfoMessage(Message):
     resolution: str
     frame_rate: str
@@ -164,7 +172,7 @@ class OutgoingSignalInfoMessage(Message):
     black_levels: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AspectRatioMessage(Message):
     resolution: str
     decimal_ratio: float
@@ -172,14 +180,14 @@ class AspectRatioMessage(Message):
     name: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MaskingRatioMessage(Message):
     resolution: str
     decimal_ratio: float
     integer_ratio: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TemperaturesMessage(Message):
     gpu: int
     hdmi_input: int
@@ -188,56 +196,56 @@ class TemperaturesMessage(Message):
     extra: tuple[int, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MacAddressMessage(Message):
     mac: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProfileGroupMessage(Message):
     group_id: str
     name: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProfileGroupEndMessage(Message):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProfileMessage(Message):
     profile_id: str
     name: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProfileEndMessage(Message):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SettingPageMessage(Message):
     page_id: str
     name: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SettingPageEndMessage(Message):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConfigPageMessage(Message):
     page_id: str
     name: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConfigPageEndMessage(Message):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OptionMessage(Message):
     option_type: str
     option_id: str
@@ -245,12 +253,12 @@ class OptionMessage(Message):
     effective_value: OptionScalar
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OptionEndMessage(Message):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChangeOptionMessage(Message):
     option_type: str
     option_id_path: str
@@ -258,152 +266,181 @@ class ChangeOptionMessage(Message):
     effective_value: OptionScalar
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InheritOptionMessage(Message):
     option_type: str
     option_id_path: str
     effective_value: OptionScalar
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ResetTemporaryMessage(Message):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Upload3DLUTFileMessage(Message):
     filename: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Rename3DLUTFileMessage(Message):
     old_filename: str
     new_filename: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Delete3DLUTFileMessage(Message):
     filename: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UploadSettingsFileMessage(Message):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StoreSettingsMessage(Message):
     target: str
     storage_name: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RestoreSettingsMessage(Message):
     target: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ToggleMessage(Message):
     option: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ToneMapOnMessage(Message):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ToneMapOffMessage(Message):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DisplayChangedMessage(Message):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RefreshLicenseInfoMessage(Message):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Force1080p60OutputMessage(Message):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HotplugMessage(Message):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FirmwareUpdateMessage(Message):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MissingHeartbeatMessage(Message):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UnknownMessage(Message):
     raw: str
 
 
 TOKEN_PATTERN = re.compile(r'"[^"]*"|\S+')
+_WELCOME_PATTERN = re.compile(r"^WELCOME to Envy v(\S+)$")
+_ERROR_PATTERN = re.compile(r'^ERROR\s+"?(.*?)"?$')
+_MAC_PATTERN = re.compile(r"^[0-9A-Fa-f:-]{17}$")
 
 
 def _tokens(line: str) -> list[str]:
-    return [token for token in TOKEN_PATTERN.findall(line)]
+    # Without quotes the pattern reduces to ``\S+``, which splits on exactly the characters ``str.split`` does.
+    if '"' not in line:
+        return line.split()
+    return TOKEN_PATTERN.findall(line)
 
 
 def _unquote(token: str) -> str:
-    if len(token) >= 2 and token[0] == '"' and token[-1] == '"':
+    if len(token) >= 2 and token[0] == '"' == token[-1]:
         return token[1:-1]
     return token
 
 
 def _to_int(value: str) -> int | None:
+    digits = value[1:] if value[:1] in ("-", "+") else value
+    if not digits.isdecimal():
+        return None
     try:
         return int(value)
+    except ValueError:  # longer than sys.get_int_max_str_digits()
+        return None
+
+
+def _to_float(value: str) -> float | None:
+    try:
+        return float(value)
     except ValueError:
         return None
 
 
-def _parse_option_scalar(option_type: str, value: str) -> OptionScalar:
-    raw = _unquote(value)
-    normalized_type = option_type.upper()
+_OPTION_TYPE_KINDS: dict[str, type[OptionScalar]] = {
+    "INTEGER": int,
+    "INT": int,
+    "FLOAT": float,
+    "DOUBLE": float,
+    "BOOLEAN": bool,
+    "BOOL": bool,
+}
+_BOOLEAN_VALUES: dict[str, bool] = {"YES": True, "TRUE": True, "ON": True, "NO": False, "FALSE": False, "OFF": False}
+
+
+def _option_kind(option_type: str) -> type[OptionScalar] | None:
+    return _OPTION_TYPE_KINDS.get(option_type.upper())
+
 
-    if normalized_type in {"INTEGER", "INT"}:
+def _parse_option_scalar(kind: type[OptionScalar] | None, value: str) -> OptionScalar:
+    # ``_unquote`` inlined: this runs for every value of every option line.
+    raw = value[1:-1] if len(value) >= 2 and value[0] == '"' == value[-1] else value
+
+    if kind is int:
         parsed = _to_int(raw)
         if parsed is not None:
             return parsed
-    elif normalized_type in {"FLOAT", "DOUBLE"}:
+    elif kind is float:
         try:
             return float(raw)
         except ValueError:
             return raw
-    elif normalized_type in {"BOOLEAN", "BOOL"}:
-        upper = raw.upper()
-        if upper in {"YES", "TRUE", "ON"}:
-            return True
-        if upper in {"NO", "FALSE", "OFF"}:
-            return False
+    elif kind is bool:
+        boolean = _BOOLEAN_VALUES.get(raw.upper())
+        if boolean is not None:
+            return boolean
 
     return raw
 
 
 def _parse_welcome(line: str) -> Message:
-    match = re.match(r"^WELCOME to Envy v([^\s]+)$", line)
+    match = _WELCOME_PATTERN.match(line)
     if match is None:
         return UnknownMessage(line)
     return WelcomeMessage(version=match.group(1))
 
 
 def _parse_error(line: str) -> Message:
-    match = re.match(r'^ERROR\s+"?(.*?)"?$', line)
+    match = _ERROR_PATTERN.match(line)
     if match is None:
         return UnknownMessage(line)
     return ErrorMessage(error=match.group(1))
@@ -412,7 +449,7 @@ def _parse_error(line: str) -> Message:
 def _parse_open_menu(tokens: list[str], line: str) -> Message:
     if len(tokens) != 2:
         return UnknownMessage(line)
-    return OpenMenuMessage(menu=_unquote(tokens[1]))
+    return OpenMenuMessage(menu=intern(_unquote(tokens[1])))
 
 
 def _parse_key(tokens: list[str], line: str) -> Message:
@@ -426,7 +463,7 @@ def _parse_key(tokens: list[str], line: str) -> Message:
 def _parse_set_aspect_ratio_mode(tokens: list[str], line: str) -> Message:
     if len(tokens) != 2:
         return UnknownMessage(line)
-    return SetAspectRatioModeMessage(mode=tokens[1])
+    return SetAspectRatioModeMessage(mode=intern(tokens[1]))
 
 
 def _parse_activate_profile(tokens: list[str], line: str) -> Message:
@@ -444,7 +481,7 @@ def _parse_active_profile(tokens: list[str], line: str) -> Message:
     index = _to_int(tokens[2])
     if index is None:
         return UnknownMessage(line)
-    return ActiveProfileMessage(profile_group=tokens[1], profile_index=index)
+    return ActiveProfileMessage(profile_group=intern(tokens[1]), profile_index=index)
 
 
 def _parse_create_profile_group(tokens: list[str], line: str) -> Message:
@@ -495,15 +532,15 @@ def _parse_incoming_signal(tokens: list[str], line: str) -> Message:
     if len(tokens) < 10:
         return UnknownMessage(line)
     return IncomingSignalInfoMessage(
-        resolution=tokens[1],
-        frame_rate=tokens[2],
-        signal_type=tokens[3],
-        color_space=tokens[4],
-        bit_depth=tokens[5],
-        hdr_mode=tokens[6],
-        colorimetry=tokens[7],
-        black_levels=tokens[8],
-        aspect_ratio=tokens[9],
+        resolution=intern(tokens[1]),
+        frame_rate=intern(tokens[2]),
+        signal_type=intern(tokens[3]),
+        color_space=intern(tokens[4]),
+        bit_depth=intern(tokens[5]),
+        hdr_mode=intern(tokens[6]),
+        colorimetry=intern(tokens[7]),
+        black_levels=intern(tokens[8]),
+        aspect_ratio=intern(tokens[9]),
     )
 
 
@@ -511,41 +548,42 @@ def _parse_outgoing_signal(tokens: list[str], line: str) -> Message:
     if len(tokens) < 9:
         return UnknownMessage(line)
     return OutgoingSignalInfoMessage(
-        resolution=tokens[1],
-        frame_rate=tokens[2],
-        signal_type=tokens[3],
-        color_space=tokens[4],
-        bit_depth=tokens[5],
-        hdr_mode=tokens[6],
-        colorimetry=tokens[7],
-        black_levels=tokens[8],
+        resolution=intern(tokens[1]),
+        frame_rate=intern(tokens[2]),
+        signal_type=intern(tokens[3]),
+        color_space=intern(tokens[4]),
+        bit_depth=intern(tokens[5]),
+        hdr_mode=intern(tokens[6]),
+        colorimetry=intern(tokens[7]),
+        black_levels=intern(tokens[8]),
     )
 
 
 def _parse_aspect_ratio(tokens: list[str], line: str) -> Message:
     if len(tokens) < 5:
         return UnknownMessage(line)
-    decimal_ratio = float(tokens[2])
+    decimal_ratio = _to_float(tokens[2])
     integer_ratio = _to_int(tokens[3])
-    if integer_ratio is None:
+    if decimal_ratio is None or integer_ratio is None:
         return UnknownMessage(line)
     return AspectRatioMessage(
-        resolution=tokens[1],
+        resolution=intern(tokens[1]),
         decimal_ratio=decimal_ratio,
         integer_ratio=integer_ratio,
-        name=_unquote(" ".join(tokens[4:])),
+        name=intern(_unquote(" ".join(tokens[4:]))),
     )
 
 
 def _parse_masking_ratio(tokens: list[str], line: str) -> Message:
     if len(tokens) != 4:
         return UnknownMessage(line)
+    decimal_ratio = _to_float(tokens[2])
     integer_ratio = _to_int(tokens[3])
-    if integer_ratio is None:
+    if decimal_ratio is None or integer_ratio is None:
         return UnknownMessage(line)
     return MaskingRatioMessage(
-        resolution=tokens[1],
-        decimal_ratio=float(tokens[2]),
+        resolution=intern(tokens[1]),
+        decimal_ratio=decimal_ratio,
         integer_ratio=integer_ratio,
     )
 
@@ -553,80 +591,73 @@ def _parse_masking_ratio(tokens: list[str], line: str) -> Message:
 def _parse_temperatures(tokens: list[str], line: str) -> Message:
     if len(tokens) < 5:
         return UnknownMessage(line)
-    values = [_to_int(token) for token in tokens[1:]]
-    if any(value is None for value in values):
-        return UnknownMessage(line)
-    safe_values = [value for value in values if value is not None]
+    values: list[int] = []
+    for token in tokens[1:]:
+        value = _to_int(token)
+        if value is None:
+            return UnknownMessage(line)
+        values.append(value)
     return TemperaturesMessage(
-        gpu=safe_values[0],
-        hdmi_input=safe_values[1],
-        cpu=safe_values[2],
-        mainboard=safe_values[3],
-        extra=tuple(safe_values[4:]),
+        gpu=values[0],
+        hdmi_input=values[1],
+        cpu=values[2],
+        mainboard=values[3],
+        extra=tuple(values[4:]),
     )
 
 
 def _parse_mac(tokens: list[str], line: str) -> Message:
     if len(tokens) != 2:
         return UnknownMessage(line)
-    if re.match(r"^[0-9A-Fa-f:-]{17}$", tokens[1]) is None:
+    if _MAC_PATTERN.match(tokens[1]) is None:
         return UnknownMessage(line)
     return MacAddressMessage(mac=tokens[1])
 
 
-def _parse_profile_group(tokens: list[str], line: str) -> Message:
-    if len(tokens) == 1 and tokens[0] == "ProfileGroup.":
-        return ProfileGroupEndMessage()
-    if len(tokens) < 3:
-        return UnknownMessage(line)
-    return ProfileGroupMessage(group_id=tokens[1], name=_unquote(" ".join(tokens[2:])))
-
-
-def _parse_profile(tokens: list[str], line: str) -> Message:
-    if len(tokens) == 1 and tokens[0] == "Profile.":
-        return ProfileEndMessage()
+def _parse_named_block_entry(
+    end_marker: str,
+    message_type: Callable[[str, str], Message],
+    end_message: Message,
+    tokens: list[str],
+    line: str,
+) -> Message:
+    if len(tokens) == 1 and tokens[0] == end_marker:
+        return end_message
     if len(tokens) < 3:
         return UnknownMessage(line)
-    return ProfileMessage(profile_id=tokens[1], name=_unquote(" ".join(tokens[2:])))
+    return message_type(tokens[1], _unquote(" ".join(tokens[2:])))
 
 
-def _parse_setting_page(tokens: list[str], line: str) -> Message:
-    if len(tokens) == 1 and tokens[0] == "SettingPage.":
-        return SettingPageEndMessage()
-    if len(tokens) < 3:
-        return UnknownMessage(line)
-    return SettingPageMessage(page_id=tokens[1], name=_unquote(" ".join(tokens[2:])))
-
-
-def _parse_config_page(tokens: list[str], line: str) -> Message:
-    if len(tokens) == 1 and tokens[0] == "ConfigPage.":
-        return ConfigPageEndMessage()
-    if len(tokens) < 3:
-        return UnknownMessage(line)
-    return ConfigPageMessage(page_id=tokens[1], name=_unquote(" ".join(tokens[2:])))
+_parse_profile_group = partial(_parse_named_block_entry, "ProfileGroup.", ProfileGroupMessage, ProfileGroupEndMessage())
+_parse_profile = partial(_parse_named_block_entry, "Profile.", ProfileMessage, ProfileEndMessage())
+_parse_setting_page = partial(_parse_named_block_entry, "SettingPage.", SettingPageMessage, SettingPageEndMessage())
+_parse_config_page = partial(_parse_named_block_entry, "ConfigPage.", ConfigPageMessage, ConfigPageEndMessage())
+_OPTION_END = OptionEndMessage()
 
 
 def _parse_option(tokens: list[str], line: str) -> Message:
     if len(tokens) == 1 and tokens[0] == "Option.":
-        return OptionEndMessage()
+        return _OPTION_END
     if len(tokens) != 5:
         return UnknownMessage(line)
+    kind = _option_kind(tokens[1])
     return OptionMessage(
-        option_type=tokens[1],
-        option_id=tokens[2],
-        current_value=_parse_option_scalar(tokens[1], tokens[3]),
-        effective_value=_parse_option_scalar(tokens[1], tokens[4]),
+        option_type=intern(tokens[1]),
+        option_id=intern(tokens[2]),
+        current_value=_parse_option_scalar(kind, tokens[3]),
+        effective_value=_parse_option_scalar(kind, tokens[4]),
     )
 
 
 def _parse_change_option(tokens: list[str], line: str) -> Message:
     if len(tokens) != 5:
         return UnknownMessage(line)
+    kind = _option_kind(tokens[1])
     return ChangeOptionMessage(
-        option_type=tokens[1],
-        option_id_path=tokens[2],
-        current_value=_parse_option_scalar(tokens[1], tokens[3]),
-        effective_value=_parse_option_scalar(tokens[1], tokens[4]),
+        option_type=intern(tokens[1]),
+        option_id_path=intern(tokens[2]),
+        current_value=_parse_option_scalar(kind, tokens[3]),
+        effective_value=_parse_option_scalar(kind, tokens[4]),
     )
 
 
@@ -634,9 +665,9 @@ def _parse_inherit_option(tokens: list[str], line: str) -> Message:
     if len(tokens) != 4:
         return UnknownMessage(line)
     return InheritOptionMessage(
-        option_type=tokens[1],
-        option_id_path=tokens[2],
-        effective_value=_parse_option_scalar(tokens[1], tokens[3]),
+        option_type=intern(tokens[1]),
+        option_id_path=intern(tokens[2]),
+        effective_value=_parse_option_scalar(_option_kind(tokens[1]), tokens[3]),
     )
 
 
@@ -670,130 +701,147 @@ def _parse_restore_settings(tokens: list[str], line: str) -> Message:
     return RestoreSettingsMessage(target=tokens[1])
 
 
+# A parser returns ``None`` when the line is not the message its head suggests.
+_Parser = Callable[[list[str], str], Message | None]
+
+
+def _parse_welcome_line(line: str) -> Message | None:
+    if not line.startswith("WELCOME to Envy v"):
+        return None
+    return _parse_welcome(line)
+
+
+def _parse_toggle(tokens: list[str], line: str) -> Message | None:
+    if len(tokens) != 2:
+        return None
+    return ToggleMessage(option=tokens[1])
+
+
+# Argument-free notifications, dispatched on the head alone without tokenizing the line. They carry
+# no fields, so every occurrence shares one frozen instance.
+_BARE_MESSAGES: dict[str, Message] = {
+    "OK": OkMessage(),
+    "Standby": StandbyMessage(),
+    "PowerOff": PowerOffMessage(),
+    "Restart": RestartMessage(),
+    "ReloadSoftware": ReloadSoftwareMessage(),
+    "NoSignal": NoSignalMessage(),
+    "CloseMenu": CloseMenuMessage(),
+    "ResetTemporary": ResetTemporaryMessage(),
+    "UploadSettingsFile": UploadSettingsFileMessage(),
+    "ToneMapOn": ToneMapOnMessage(),
+    "ToneMapOff": ToneMapOffMessage(),
+    "DisplayChanged": DisplayChangedMessage(),
+    "RefreshLicenseInfo": RefreshLicenseInfoMessage(),
+    "Force1080p60Output": Force1080p60OutputMessage(),
+    "Hotplug": HotplugMessage(),
+    "FirmwareUpdate": FirmwareUpdateMessage(),
+    "MissingHeartbeat": MissingHeartbeatMessage(),
+}
+
+# Messages matched against the whole line, without tokenizing it.
+_LINE_PARSERS: dict[str, Callable[[str], Message | None]] = {
+    "WELCOME": _parse_welcome_line,
+    "ERROR": _parse_error,
+}
+
+# Heads of tokenized messages; enumeration blocks end with the head followed by ``.``.
+_PARSERS: dict[str, _Parser] = {
+    "OpenMenu": _parse_open_menu,
+    "KeyPress": _parse_key,
+    "KeyHold": _parse_key,
+    "SetAspectRatioMode": _parse_set_aspect_ratio_mode,
+    "ActivateProfile": _parse_activate_profile,
+    "ActiveProfile": _parse_active_profile,
+    "CreateProfileGroup": _parse_create_profile_group,
+    "RenameProfileGroup": _parse_rename_profile_group,
+    "DeleteProfileGroup": _parse_delete_profile_group,
+    "CreateProfile": _parse_profile_change,
+    "RenameProfile": _parse_profile_change,
+    "DeleteProfile": _parse_profile_change,
+    "AddProfileToPage": _parse_profile_page_link,
+    "RemoveProfileFromPage": _parse_profile_page_link,
+    "IncomingSignalInfo": _parse_incoming_signal,
+    "OutgoingSignalInfo": _parse_outgoing_signal,
+    "AspectRatio": _parse_aspect_ratio,
+    "MaskingRatio": _parse_masking_ratio,
+    "Temperatures": _parse_temperatures,
+    "MacAddress": _parse_mac,
+    "ProfileGroup": _parse_profile_group,
+    "ProfileGroup.": _parse_profile_group,
+    "Profile": _parse_profile,
+    "Profile.": _parse_profile,
+    "SettingPage": _parse_setting_page,
+    "SettingPage.": _parse_setting_page,
+    "ConfigPage": _parse_config_page,
+    "ConfigPage.": _parse_config_page,
+    "Option": _parse_option,
+    "Option.": _parse_option,
+    "ChangeOption": _parse_change_option,
+    "InheritOption": _parse_inherit_option,
+    "Upload3DLUTFile": _parse_upload_3dlut_file,
+    "Rename3DLUTFile": _parse_rename_3dlut_file,
+    "Delete3DLUTFile": _parse_delete_3dlut_file,
+    "StoreSettings": _parse_store_settings,
+    "RestoreSettings": _parse_restore_settings,
+    "Toggle": _parse_toggle,
+}
+
+
 def parse_message(line: str) -> Message:
     """Parse one line from the Envy stream."""
+    if len(line) > _PARSE_CACHE_MAX_LINE_LENGTH:
+        return _parse_message(line)
+    return _parse_message_cached(line)
+
+
+def _parse_message(line: str) -> Message:
     normalized = line.strip()
     if normalized == "":
         return UnknownMessage(line)
-    tokens = _tokens(normalized)
-    head = tokens[0]
+    head = normalized.split(None, 1)[0]
 
-    try:
-        if normalized.startswith("WELCOME to Envy v"):
-            return _parse_welcome(normalized)
-        if head == "OK":
-            return OkMessage()
-        if head == "ERROR":
-            return _parse_error(normalized)
-        if head == "Standby":
-            return StandbyMessage()
-        if head == "PowerOff":
-            return PowerOffMessage()
-        if head == "Restart":
-            return RestartMessage()
-        if head == "ReloadSoftware":
-            return ReloadSoftwareMessage()
-        if head == "NoSignal":
-            return NoSignalMessage()
-        if head == "OpenMenu":
-            return _parse_open_menu(tokens, normalized)
-        if head == "CloseMenu":
-            return CloseMenuMessage()
-        if head in {"KeyPress", "KeyHold"}:
-            return _parse_key(tokens, normalized)
-        if head == "SetAspectRatioMode":
-            return _parse_set_aspect_ratio_mode(tokens, normalized)
-        if head == "ActivateProfile":
-            return _parse_activate_profile(tokens, normalized)
-        if head == "ActiveProfile":
-            return _parse_active_profile(tokens, normalized)
-        if head == "CreateProfileGroup":
-            return _parse_create_profile_group(tokens, normalized)
-        if head == "RenameProfileGroup":
-            return _parse_rename_profile_group(tokens, normalized)
-        if head == "DeleteProfileGroup":
-            return _parse_delete_profile_group(tokens, normalized)
-        if head in {"CreateProfile", "RenameProfile", "DeleteProfile"}:
-            return _parse_profile_change(tokens, normalized)
-        if head in {"AddProfileToPage", "RemoveProfileFromPage"}:
-            return _parse_profile_page_link(tokens, normalized)
-        if head == "IncomingSignalInfo":
-            return _parse_incoming_signal(tokens, normalized)
-        if head == "OutgoingSignalInfo":
-            return _parse_outgoing_signal(tokens, normalized)
-        if head == "AspectRatio":
-            return _parse_aspect_ratio(tokens, normalized)
-        if head == "MaskingRatio":
-            return _parse_masking_ratio(tokens, normalized)
-        if head == "Temperatures":
-            return _parse_temperatures(tokens, normalized)
-        if head == "MacAddress":
-            return _parse_mac(tokens, normalized)
-        if head.startswith("ProfileGroup"):
-            return _parse_profile_group(tokens, normalized)
-        if head.startswith("Profile"):
-            return _parse_profile(tokens, normalized)
-        if head.startswith("SettingPage"):
-            return _parse_setting_page(tokens, normalized)
-        if head.startswith("ConfigPage"):
-            return _parse_config_page(tokens, normalized)
-        if head.startswith("Option"):
-            return _parse_option(tokens, normalized)
-        if head == "ChangeOption":
-            return _parse_change_option(tokens, normalized)
-        if head == "InheritOption":
-            return _parse_inherit_option(tokens, normalized)
-        if head == "ResetTemporary":
-            return ResetTemporaryMessage()
-        if head == "Upload3DLUTFile":
-            return _parse_upload_3dlut_file(tokens, normalized)
-        if head == "Rename3DLUTFile":
-            return _parse_rename_3dlut_file(tokens, normalized)
-        if head == "Delete3DLUTFile":
-            return _parse_delete_3dlut_file(tokens, normalized)
-        if head == "UploadSettingsFile":
-            return UploadSettingsFileMessage()
-        if head == "StoreSettings":
-            return _parse_store_settings(tokens, normalized)
-        if head == "RestoreSettings":
-            return _parse_restore_settings(tokens, normalized)
-        if head == "Toggle" and len(tokens) == 2:
-            return ToggleMessage(option=tokens[1])
-        if head == "ToneMapOn":
-            return ToneMapOnMessage()
-        if head == "ToneMapOff":
-            return ToneMapOffMessage()
-        if head == "DisplayChanged":
-            return DisplayChangedMessage()
-        if head == "RefreshLicenseInfo":
-            return RefreshLicenseInfoMessage()
-        if head == "Force1080p60Output":
-            return Force1080p60OutputMessage()
-        if head == "Hotplug":
-            return HotplugMessage()
-        if head == "FirmwareUpdate":
-            return FirmwareUpdateMessage()
-        if head == "MissingHeartbeat":
-            return MissingHeartbeatMessage()
-    except (ValueError, IndexError):
-        return UnknownMessage(line)
-
-    return UnknownMessage(line)
+    bare_message = _BARE_MESSAGES.get(head)
+    if bare_message is not None:
+        return bare_message
+    line_parser = _LINE_PARSERS.get(head)
+    if line_parser is not None:
+        message = line_parser(normalized)
+        return message if message is not None else UnknownMessage(line)
+    parser = _PARSERS.get(head)
+    if parser is None:
+        return UnknownMessage(line)
+    # Parsers check token counts and convert numbers through ``_to_int``/``_to_float``, so they never raise.
+    message = parser(_tokens(normalized), normalized)
+    return message if message is not None else UnknownMessage(line)
+
+
+def parse_messages(buffer: str | bytes, encoding: str = "utf-8") -> list[Message]:
+    """Parse every non-blank line of an LF or CRLF delimited buffer."""
+    if isinstance(buffer, bytes):
+        buffer = buffer.decode(encoding, errors="replace")
+    parse = parse_message
+    return [parse(line.rstrip("\r")) for line in buffer.split("\n") if line.strip()]
+
+
+# Messages are frozen, so repeated lines (heartbeats, polls, unchanged signal info) can share one parse.
+# Long lines such as option dumps rarely repeat and would only churn the cache.
+_PARSE_CACHE_MAX_LINE_LENGTH = 256
+_parse_message_cached = lru_cache(maxsize=1024)(_parse_message)
 
 
 def quote_if_needed(value: str) -> str:
     """Quote command parameter only when required by protocol syntax."""
-    if " " in value and not (value.startswith('"') and value.endswith('"')):
-        return f'"{value}"'
-    return value
+    if " " not in value or (value[:1] == '"' and value[-1:] == '"'):
+        return value
+    return f'"{value}"'
 
 
 def build_command(command: str, *args: str | int) -> str:
     """Build one protocol command line without CRLF."""
+    if not args:
+        return command
     rendered: list[str] = [command]
     for arg in args:
-        if isinstance(arg, int):
-            rendered.append(str(arg))
-        else:
-            rendered.append(quote_if_needed(arg))
+        rendered.append(str(arg) if isinstance(arg, int) else quote_if_needed(arg))
     return " ".join(rendered)
@@ -5,7 +5,15 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from enum import StrEnum
 
-from madvr_envy.adapter import EnvySnapshot, snapshot_from_state
+from madvr_envy.adapter import (
+    AspectRatioView,
+    EnvySnapshot,
+    IncomingSignalView,
+    MaskingRatioView,
+    OutgoingSignalView,
+    TemperaturesView,
+    snapshot_from_state,
+)
 from madvr_envy.state import EnvyState
 
 
@@ -33,7 +41,7 @@ class EnvyRuntimeSnapshot:
     active_profile_group: str | None
     active_profile_index: int | None
     tone_map_enabled: bool | None
-    temperatures: tuple[int, int, int, int] | None
+    temperatures: TemperaturesView | None
     incoming_signal: dict[str, str] | None
     outgoing_signal: dict[str, str] | None
     aspect_ratio: dict[str, str | float] | None
@@ -86,50 +94,31 @@ def runtime_snapshot_from_state(state: EnvyState, *, connected: bool) -> EnvyRun
     return runtime_snapshot_from_snapshot(snapshot_from_state(state), connected=connected)
 
 
-def _signal_map(value: tuple[str, str, str, str, str, str, str, str, str] | None) -> dict[str, str] | None:
+def _signal_map(value: IncomingSignalView | None) -> dict[str, str] | None:
     if value is None:
         return None
-    return {
-        "resolution": value[0],
-        "frame_rate": value[1],
-        "signal_type": value[2],
-        "color_space": value[3],
-        "bit_depth": value[4],
-        "hdr_mode": value[5],
-        "colorimetry": value[6],
-        "black_levels": value[7],
-        "aspect_ratio": value[8],
-    }
+    return value._asdict()
 
 
-def _output_signal_map(value: tuple[str, str, str, str, str, str, str, str] | None) -> dict[str, str] | None:
+def _output_signal_map(value: OutgoingSignalView | None) -> dict[str, str] | None:
     if value is None:
         return None
-    return {
-        "resolution": value[0],
-        "frame_rate": value[1],
-        "signal_type": value[2],
-        "color_space": value[3],
-        "bit_depth": value[4],
-        "hdr_mode": value[5],
-        "colorimetry": value[6],
-        "black_levels": value[7],
-    }
+    return value._asdict()
 
 
-def _aspect_ratio_map(value: tuple[str, float, int, str] | None) -> dict[str, str | float] | None:
+def _aspect_ratio_map(value: AspectRatioView | None) -> dict[str, str | float] | None:
     if value is None:
         return None
     return {
-        "resolution": value[0],
-        "decimal_ratio": value[1],
-        "name": value[3],
+        "resolution": value.resolution,
+        "decimal_ratio": value.decimal_ratio,
+        "name": value.name,
     }
 
 
-def _masking_ratio_map(value: tuple[str, float, int] | None) -> dict[str, float] | None:
+def _masking_ratio_map(value: MaskingRatioView | None) -> dict[str, float] | None:
     if value is None:
         return None
     return {
-        "decimal_ratio": value[1],
+        "decimal_ratio": value.decimal_ratio,
     }
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from collections.abc import Callable, Iterable
+from dataclasses import MISSING, dataclass, field, fields
+from operator import itemgetter
+from typing import Any, TypeVar, cast
 
 from madvr_envy.protocol import (
     ActivateProfileMessage,
@@ -58,9 +61,137 @@ from madvr_envy.protocol import (
     WelcomeMessage,
 )
 
+_KT = TypeVar("_KT")
+_VT = TypeVar("_VT")
 
-@dataclass
+_item_key = itemgetter(0)
+
+
+class SortedItemsDict(dict[_KT, _VT]):
+    """Dict that memoizes its key-sorted items until the next mutation."""
+
+    __slots__ = ("_sorted_items",)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._sorted_items: tuple[tuple[_KT, _VT], ...] | None = None
+
+    def sorted_items(self) -> tuple[tuple[_KT, _VT], ...]:
+        """Return ``(key, value)`` pairs sorted by key, reusing the last result while unchanged."""
+        items = self._sorted_items
+        if items is None:
+            items = self._sorted_items = tuple(sorted(self.items(), key=_item_key))
+        return items
+
+    def __setitem__(self, key: _KT, value: _VT) -> None:
+        self._sorted_items = None
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: _KT) -> None:
+        self._sorted_items = None
+        super().__delitem__(key)
+
+    def __ior__(self, other: Any) -> SortedItemsDict[_KT, _VT]:
+        self._sorted_items = None
+        return super().__ior__(other)
+
+    def pop(self, *args: Any) -> Any:
+        self._sorted_items = None
+        return super().pop(*args)
+
+    def popitem(self) -> tuple[_KT, _VT]:
+        self._sorted_items = None
+        return super().popitem()
+
+    def setdefault(self, key: _KT, default: Any = None) -> Any:
+        self._sorted_items = None
+        return super().setdefault(key, default)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        self._sorted_items = None
+        super().update(*args, **kwargs)
+
+    def clear(self) -> None:
+        self._sorted_items = None
+        super().clear()
+
+
+def _sorted_items(mapping: dict[_KT, _VT]) -> tuple[tuple[_KT, _VT], ...]:
+    """Return key-sorted items, memoized when ``mapping`` is a ``SortedItemsDict``."""
+    if isinstance(mapping, SortedItemsDict):
+        return mapping.sorted_items()
+    return tuple(sorted(mapping.items(), key=_item_key))
+
+
+# Container fields that ``EnvyState.__post_init__`` converts to ``SortedItemsDict``.
+_SORTED_ITEMS_FIELDS = ("settings_pages", "config_pages", "profile_groups", "profiles", "options")
+
+
+# State fields written by each message type, used to answer ``changed_fields_since``.
+_MESSAGE_FIELDS: dict[type[Message], tuple[str, ...]] = {
+    WelcomeMessage: ("version", "synced", "is_on", "standby"),
+    StandbyMessage: ("is_on", "standby"),
+    PowerOffMessage: ("is_on", "standby"),
+    RestartMessage: ("last_system_action",),
+    ReloadSoftwareMessage: ("last_system_action",),
+    NoSignalMessage: ("signal_present",),
+    OpenMenuMessage: ("current_menu",),
+    CloseMenuMessage: ("current_menu",),
+    KeyPressMessage: ("last_button_event",),
+    KeyHoldMessage: ("last_button_event",),
+    SetAspectRatioModeMessage: ("aspect_ratio_mode",),
+    MacAddressMessage: ("mac_address",),
+    TemperaturesMessage: ("temperatures",),
+    IncomingSignalInfoMessage: ("incoming_signal", "signal_present"),
+    OutgoingSignalInfoMessage: ("outgoing_signal",),
+    AspectRatioMessage: ("aspect_ratio",),
+    MaskingRatioMessage: ("masking_ratio",),
+    ActiveProfileMessage: ("active_profile_group", "active_profile_index"),
+    ActivateProfileMessage: ("active_profile_group", "active_profile_index"),
+    CreateProfileGroupMessage: ("profile_groups",),
+    RenameProfileGroupMessage: ("profile_groups",),
+    ProfileGroupMessage: ("profile_groups",),
+    DeleteProfileGroupMessage: ("profile_groups",),
+    CreateProfileMessage: ("profiles",),
+    RenameProfileMessage: ("profiles",),
+    ProfileMessage: ("profiles",),
+    DeleteProfileMessage: ("profiles",),
+    SettingPageMessage: ("settings_pages",),
+    ConfigPageMessage: ("config_pages",),
+    OptionMessage: ("options",),
+    ChangeOptionMessage: ("last_option_change", "options"),
+    InheritOptionMessage: ("last_inherit_option",),
+    ResetTemporaryMessage: ("temporary_reset_count",),
+    Upload3DLUTFileMessage: ("last_uploaded_3dlut",),
+    Rename3DLUTFileMessage: ("last_renamed_3dlut",),
+    Delete3DLUTFileMessage: ("last_deleted_3dlut",),
+    UploadSettingsFileMessage: ("settings_upload_count",),
+    StoreSettingsMessage: ("last_store_settings",),
+    RestoreSettingsMessage: ("last_restore_settings",),
+    ToggleMessage: ("last_system_action",),
+    ToneMapOnMessage: ("tone_map_enabled",),
+    ToneMapOffMessage: ("tone_map_enabled",),
+    DisplayChangedMessage: ("display_changed_count",),
+    RefreshLicenseInfoMessage: ("last_system_action",),
+    Force1080p60OutputMessage: ("last_system_action",),
+    HotplugMessage: ("last_system_action",),
+    FirmwareUpdateMessage: ("firmware_update_pending",),
+    MissingHeartbeatMessage: ("last_missing_heartbeat",),
+    AddProfileToPageMessage: ("last_system_action",),
+    RemoveProfileFromPageMessage: ("last_system_action",),
+}
+
+
+@dataclass(slots=True)
 class EnvyState:
+    """Device state built up from parsed messages.
+
+    ``changed_fields_since`` only sees writes made through ``apply``, ``apply_many`` and
+    ``reset_runtime_values``. Adapters additionally notice fields that were assigned directly;
+    after mutating a container field in place outside ``apply``, call ``touch`` so adapters
+    compare every field on their next update.
+    """
+
     version: str | None = None
     is_on: bool | None = None
     standby: bool | None = None
@@ -78,11 +209,11 @@ class EnvyState:
     current_menu: str | None = None
     aspect_ratio_mode: str | None = None
     last_button_event: tuple[str, str] | None = None
-    settings_pages: dict[str, str] = field(default_factory=dict)
-    config_pages: dict[str, str] = field(default_factory=dict)
-    profile_groups: dict[str, str] = field(default_factory=dict)
-    profiles: dict[str, str] = field(default_factory=dict)
-    options: dict[str, OptionMessage] = field(default_factory=dict)
+    settings_pages: SortedItemsDict[str, str] = field(default_factory=SortedItemsDict)
+    config_pages: SortedItemsDict[str, str] = field(default_factory=SortedItemsDict)
+    profile_groups: SortedItemsDict[str, str] = field(default_factory=SortedItemsDict)
+    profiles: SortedItemsDict[str, str] = field(default_factory=SortedItemsDict)
+    options: SortedItemsDict[str, OptionMessage] = field(default_factory=SortedItemsDict)
     tone_map_enabled: bool | None = None
 
     last_option_change: ChangeOptionMessage | None = None
@@ -99,156 +230,377 @@ class EnvyState:
     last_missing_heartbeat: bool = False
     last_system_action: str | None = None
 
-    _seen_welcome: bool = False
+    # Set by the Welcome handler, not by callers.
+    synced: bool = field(default=False, init=False)
+    _revision: int = field(default=0, init=False, repr=False, compare=False)
+    _field_revisions: dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _untracked_revision: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        for name in _SORTED_ITEMS_FIELDS:
+            value = getattr(self, name)
+            if not isinstance(value, SortedItemsDict):
+                setattr(self, name, SortedItemsDict(value))
 
     def reset_runtime_values(self) -> None:
-        self.version = None
-        self.is_on = None
-        self.standby = None
-        self.mac_address = None
-
-        self.active_profile_group = None
-        self.active_profile_index = None
-
-        self.incoming_signal = None
-        self.outgoing_signal = None
-        self.aspect_ratio = None
-        self.masking_ratio = None
-        self.temperatures = None
-        self.signal_present = None
-        self.current_menu = None
-        self.aspect_ratio_mode = None
-        self.last_button_event = None
-        self.settings_pages = {}
-        self.config_pages = {}
-        self.profile_groups = {}
-        self.profiles = {}
-        self.options = {}
-        self.tone_map_enabled = None
-        self.last_option_change = None
-        self.last_inherit_option = None
-        self.last_uploaded_3dlut = None
-        self.last_renamed_3dlut = None
-        self.last_deleted_3dlut = None
-        self.settings_upload_count = 0
-        self.last_store_settings = None
-        self.last_restore_settings = None
-        self.temporary_reset_count = 0
-        self.display_changed_count = 0
-        self.firmware_update_pending = False
-        self.last_missing_heartbeat = False
-        self.last_system_action = None
-
-        self._seen_welcome = False
+        _reset_fields(self)
+
+        self._revision += 1
+        self._field_revisions.clear()
+        self._untracked_revision = self._revision
 
     def apply(self, message: Message) -> None:
-        if isinstance(message, WelcomeMessage):
-            self.version = message.version
-            self._seen_welcome = True
-            self.is_on = True
-            self.standby = False
-        elif isinstance(message, StandbyMessage):
-            self.is_on = False
-            self.standby = True
-        elif isinstance(message, PowerOffMessage):
-            self.is_on = False
-            self.standby = False
-        elif isinstance(message, RestartMessage):
-            self.last_system_action = "Restart"
-        elif isinstance(message, ReloadSoftwareMessage):
-            self.last_system_action = "ReloadSoftware"
-        elif isinstance(message, NoSignalMessage):
-            self.signal_present = False
-        elif isinstance(message, OpenMenuMessage):
-            self.current_menu = message.menu
-        elif isinstance(message, CloseMenuMessage):
-            self.current_menu = None
-        elif isinstance(message, KeyPressMessage):
-            self.last_button_event = ("press", message.button)
-        elif isinstance(message, KeyHoldMessage):
-            self.last_button_event = ("hold", message.button)
-        elif isinstance(message, SetAspectRatioModeMessage):
-            self.aspect_ratio_mode = message.mode
-        elif isinstance(message, MacAddressMessage):
-            self.mac_address = message.mac
-        elif isinstance(message, TemperaturesMessage):
-            self.temperatures = message
-        elif isinstance(message, IncomingSignalInfoMessage):
-            self.incoming_signal = message
-            self.signal_present = True
-        elif isinstance(message, OutgoingSignalInfoMessage):
-            self.outgoing_signal = message
-        elif isinstance(message, AspectRatioMessage):
-            self.aspect_ratio = message
-        elif isinstance(message, MaskingRatioMessage):
-            self.masking_ratio = message
-        elif isinstance(message, (ActiveProfileMessage, ActivateProfileMessage)):
-            self.active_profile_group = message.profile_group
-            self.active_profile_index = message.profile_index
-        elif isinstance(message, (CreateProfileGroupMessage, RenameProfileGroupMessage, ProfileGroupMessage)):
-            self.profile_groups[message.group_id] = message.name
-        elif isinstance(message, DeleteProfileGroupMessage):
-            self.profile_groups.pop(message.group_id, None)
-        elif isinstance(message, (CreateProfileMessage, RenameProfileMessage, ProfileMessage)):
-            if isinstance(message, ProfileMessage):
-                self.profiles[message.profile_id] = message.name
-            else:
-                key = f"{message.profile_group}_{message.profile_index}"
-                self.profiles[key] = message.name
-        elif isinstance(message, DeleteProfileMessage):
-            key = f"{message.profile_group}_{message.profile_index}"
-            self.profiles.pop(key, None)
-        elif isinstance(message, SettingPageMessage):
-            self.settings_pages[message.page_id] = message.name
-        elif isinstance(message, ConfigPageMessage):
-            self.config_pages[message.page_id] = message.name
-        elif isinstance(message, OptionMessage):
-            self.options[message.option_id] = message
-        elif isinstance(message, ChangeOptionMessage):
-            self.last_option_change = message
-            self.options[message.option_id_path] = OptionMessage(
-                option_type=message.option_type,
-                option_id=message.option_id_path,
-                current_value=message.current_value,
-                effective_value=message.effective_value,
-            )
-        elif isinstance(message, InheritOptionMessage):
-            self.last_inherit_option = message
-        elif isinstance(message, ResetTemporaryMessage):
-            self.temporary_reset_count += 1
-        elif isinstance(message, Upload3DLUTFileMessage):
-            self.last_uploaded_3dlut = message.filename
-        elif isinstance(message, Rename3DLUTFileMessage):
-            self.last_renamed_3dlut = (message.old_filename, message.new_filename)
-        elif isinstance(message, Delete3DLUTFileMessage):
-            self.last_deleted_3dlut = message.filename
-        elif isinstance(message, UploadSettingsFileMessage):
-            self.settings_upload_count += 1
-        elif isinstance(message, StoreSettingsMessage):
-            self.last_store_settings = (message.target, message.storage_name)
-        elif isinstance(message, RestoreSettingsMessage):
-            self.last_restore_settings = message.target
-        elif isinstance(message, ToggleMessage):
-            self.last_system_action = f"Toggle:{message.option}"
-        elif isinstance(message, ToneMapOnMessage):
-            self.tone_map_enabled = True
-        elif isinstance(message, ToneMapOffMessage):
-            self.tone_map_enabled = False
-        elif isinstance(message, DisplayChangedMessage):
-            self.display_changed_count += 1
-        elif isinstance(message, RefreshLicenseInfoMessage):
-            self.last_system_action = "RefreshLicenseInfo"
-        elif isinstance(message, Force1080p60OutputMessage):
-            self.last_system_action = "Force1080p60Output"
-        elif isinstance(message, HotplugMessage):
-            self.last_system_action = "Hotplug"
-        elif isinstance(message, FirmwareUpdateMessage):
-            self.firmware_update_pending = True
-        elif isinstance(message, MissingHeartbeatMessage):
-            self.last_missing_heartbeat = True
-        elif isinstance(message, (AddProfileToPageMessage, RemoveProfileFromPageMessage)):
-            self.last_system_action = message.__class__.__name__
+        message_type = type(message)
+        handler = _APPLY_HANDLERS.get(message_type, _UNRESOLVED)
+        if handler is _UNRESOLVED:
+            handler = _APPLY_HANDLERS[message_type] = _resolve_apply_handler(message_type)
+        if handler is None:
+            return
+        handler(self, message)
+
+        self._revision += 1
+        written = _MESSAGE_FIELDS.get(message_type)
+        if written is None:
+            self._untracked_revision = self._revision
+            return
+        field_revisions = self._field_revisions
+        for name in written:
+            field_revisions[name] = self._revision
+
+    def apply_many(self, messages: Iterable[Message]) -> None:
+        """Apply ``messages`` in order; equivalent to calling ``apply`` on each one."""
+        handlers = _APPLY_HANDLERS
+        message_fields = _MESSAGE_FIELDS
+        field_revisions = self._field_revisions
+        for message in messages:
+            message_type = type(message)
+            handler = handlers.get(message_type, _UNRESOLVED)
+            if handler is _UNRESOLVED:
+                handler = handlers[message_type] = _resolve_apply_handler(message_type)
+            if handler is None:
+                continue
+            handler(self, message)
+
+            revision = self._revision = self._revision + 1
+            written = message_fields.get(message_type)
+            if written is None:
+                self._untracked_revision = revision
+                continue
+            for name in written:
+                field_revisions[name] = revision
+
+    def touch(self) -> None:
+        """Mark every field as changed, for callers that mutated container fields in place."""
+        self._revision += 1
+        self._untracked_revision = self._revision
 
     @property
-    def synced(self) -> bool:
-        return self._seen_welcome
+    def revision(self) -> int:
+        """Counter bumped whenever ``apply``, ``reset_runtime_values`` or ``touch`` changes state."""
+        return self._revision
+
+    def changed_fields_since(self, revision: int) -> set[str] | None:
+        """Return the fields written after ``revision``, or ``None`` when that is not tracked.
+
+        ``None`` is returned when a reset or an untracked message subclass happened after
+        ``revision``; callers should then compare every field.
+        """
+        if revision < self._untracked_revision:
+            return None
+        return {name for name, changed_at in self._field_revisions.items() if changed_at > revision}
+
+
+# The revision bookkeeping fields are not runtime values and survive ``reset_runtime_values``.
+_TRACKING_FIELDS = frozenset({"_revision", "_field_revisions", "_untracked_revision"})
+
+
+def _compile_field_reset() -> Callable[[EnvyState], None]:
+    """Generate a function that restores every runtime field to its declared default.
+
+    The body is built from ``fields(EnvyState)`` at import time, so it cannot drift from the
+    dataclass defaults and runs as straight-line slot stores instead of a ``setattr`` loop.
+    Container fields are cleared rather than reallocated, and left alone when already empty.
+    """
+    lines = ["def _reset_fields(state):"]
+    namespace: dict[str, Any] = {}
+    for state_field in fields(EnvyState):
+        name = state_field.name
+        if name in _TRACKING_FIELDS:
+            continue
+        if state_field.default_factory is not MISSING:
+            lines.append(f"    if state.{name}:")
+            lines.append(f"        state.{name}.clear()")
+        else:
+            namespace[f"_default_{name}"] = state_field.default
+            lines.append(f"    state.{name} = _default_{name}")
+    exec("\n".join(lines), namespace)
+    return cast(Callable[[EnvyState], None], namespace["_reset_fields"])
+
+
+_reset_fields = _compile_field_reset()
+
+
+def _apply_welcome(state: EnvyState, message: WelcomeMessage) -> None:
+    state.version = message.version
+    state.synced = True
+    state.is_on = True
+    state.standby = False
+
+
+def _apply_standby(state: EnvyState, message: StandbyMessage) -> None:
+    state.is_on = False
+    state.standby = True
+
+
+def _apply_power_off(state: EnvyState, message: PowerOffMessage) -> None:
+    state.is_on = False
+    state.standby = False
+
+
+def _system_action(action: str) -> Callable[[EnvyState, Message], None]:
+    def apply(state: EnvyState, message: Message) -> None:
+        state.last_system_action = action
+
+    return apply
+
+
+def _apply_no_signal(state: EnvyState, message: NoSignalMessage) -> None:
+    state.signal_present = False
+
+
+def _apply_open_menu(state: EnvyState, message: OpenMenuMessage) -> None:
+    state.current_menu = message.menu
+
+
+def _apply_close_menu(state: EnvyState, message: CloseMenuMessage) -> None:
+    state.current_menu = None
+
+
+def _apply_key_press(state: EnvyState, message: KeyPressMessage) -> None:
+    state.last_button_event = ("press", message.button)
+
+
+def _apply_key_hold(state: EnvyState, message: KeyHoldMessage) -> None:
+    state.last_button_event = ("hold", message.button)
+
+
+def _apply_aspect_ratio_mode(state: EnvyState, message: SetAspectRatioModeMessage) -> None:
+    state.aspect_ratio_mode = message.mode
+
+
+def _apply_mac_address(state: EnvyState, message: MacAddressMessage) -> None:
+    state.mac_address = message.mac
+
+
+def _apply_temperatures(state: EnvyState, message: TemperaturesMessage) -> None:
+    state.temperatures = message
+
+
+def _apply_incoming_signal(state: EnvyState, message: IncomingSignalInfoMessage) -> None:
+    state.incoming_signal = message
+    state.signal_present = True
+
+
+def _apply_outgoing_signal(state: EnvyState, message: OutgoingSignalInfoMessage) -> None:
+    state.outgoing_signal = message
+
+
+def _apply_aspect_ratio(state: EnvyState, message: AspectRatioMessage) -> None:
+    state.aspect_ratio = message
+
+
+def _apply_masking_ratio(state: EnvyState, message: MaskingRatioMessage) -> None:
+    state.masking_ratio = message
+
+
+def _apply_active_profile(state: EnvyState, message: ActiveProfileMessage | ActivateProfileMessage) -> None:
+    state.active_profile_group = message.profile_group
+    state.active_profile_index = message.profile_index
+
+
+def _apply_profile_group(
+    state: EnvyState,
+    message: CreateProfileGroupMessage | RenameProfileGroupMessage | ProfileGroupMessage,
+) -> None:
+    state.profile_groups[message.group_id] = message.name
+
+
+def _apply_delete_profile_group(state: EnvyState, message: DeleteProfileGroupMessage) -> None:
+    state.profile_groups.pop(message.group_id, None)
+
+
+def _apply_profile(state: EnvyState, message: ProfileMessage) -> None:
+    state.profiles[message.profile_id] = message.name
+
+
+def _apply_profile_change(state: EnvyState, message: CreateProfileMessage | RenameProfileMessage) -> None:
+    state.profiles[f"{message.profile_group}_{message.profile_index}"] = message.name
+
+
+def _apply_delete_profile(state: EnvyState, message: DeleteProfileMessage) -> None:
+    state.profiles.pop(f"{message.profile_group}_{message.profile_index}", None)
+
+
+def _apply_setting_page(state: EnvyState, message: SettingPageMessage) -> None:
+    state.settings_pages[message.page_id] = message.name
+
+
+def _apply_config_page(state: EnvyState, message: ConfigPageMessage) -> None:
+    state.config_pages[message.page_id] = message.name
+
+
+def _apply_option(state: EnvyState, message: OptionMessage) -> None:
+    state.options[message.option_id] = message
+
+
+def _apply_change_option(state: EnvyState, message: ChangeOptionMessage) -> None:
+    state.last_option_change = message
+    # Options are frozen; keep the stored entry (and the memoized sorted items) when nothing changed.
+    existing = state.options.get(message.option_id_path)
+    if (
+        existing is not None
+        and existing.option_type == message.option_type
+        and existing.current_value == message.current_value
+        and existing.effective_value == message.effective_value
+    ):
+        return
+    state.options[message.option_id_path] = OptionMessage(
+        option_type=message.option_type,
+        option_id=message.option_id_path,
+        current_value=message.current_value,
+        effective_value=message.effective_value,
+    )
+
+
+def _apply_inherit_option(state: EnvyState, message: InheritOptionMessage) -> None:
+    state.last_inherit_option = message
+
+
+def _apply_reset_temporary(state: EnvyState, message: ResetTemporaryMessage) -> None:
+    state.temporary_reset_count += 1
+
+
+def _apply_upload_3dlut(state: EnvyState, message: Upload3DLUTFileMessage) -> None:
+    state.last_uploaded_3dlut = message.filename
+
+
+def _apply_rename_3dlut(state: EnvyState, message: Rename3DLUTFileMessage) -> None:
+    state.last_renamed_3dlut = (message.old_filename, message.new_filename)
+
+
+def _apply_delete_3dlut(state: EnvyState, message: Delete3DLUTFileMessage) -> None:
+    state.last_deleted_3dlut = message.filename
+
+
+def _apply_upload_settings(state: EnvyState, message: UploadSettingsFileMessage) -> None:
+    state.settings_upload_count += 1
+
+
+def _apply_store_settings(state: EnvyState, message: StoreSettingsMessage) -> None:
+    state.last_store_settings = (message.target, message.storage_name)
+
+
+def _apply_restore_settings(state: EnvyState, message: RestoreSettingsMessage) -> None:
+    state.last_restore_settings = message.target
+
+
+def _apply_toggle(state: EnvyState, message: ToggleMessage) -> None:
+    state.last_system_action = f"Toggle:{message.option}"
+
+
+def _apply_tone_map_on(state: EnvyState, message: ToneMapOnMessage) -> None:
+    state.tone_map_enabled = True
+
+
+def _apply_tone_map_off(state: EnvyState, message: ToneMapOffMessage) -> None:
+    state.tone_map_enabled = False
+
+
+def _apply_display_changed(state: EnvyState, message: DisplayChangedMessage) -> None:
+    state.display_changed_count += 1
+
+
+def _apply_firmware_update(state: EnvyState, message: FirmwareUpdateMessage) -> None:
+    state.firmware_update_pending = True
+
+
+def _apply_missing_heartbeat(state: EnvyState, message: MissingHeartbeatMessage) -> None:
+    state.last_missing_heartbeat = True
+
+
+_ApplyHandler = Callable[[EnvyState, Any], None]
+
+# ``EnvyState.apply`` handler per concrete message type. Subclasses are resolved through their MRO on
+# first sight and cached here; ``None`` marks message types that do not touch state.
+_APPLY_HANDLERS: dict[type[Message], _ApplyHandler | None] = {
+    WelcomeMessage: _apply_welcome,
+    StandbyMessage: _apply_standby,
+    PowerOffMessage: _apply_power_off,
+    RestartMessage: _system_action("Restart"),
+    ReloadSoftwareMessage: _system_action("ReloadSoftware"),
+    NoSignalMessage: _apply_no_signal,
+    OpenMenuMessage: _apply_open_menu,
+    CloseMenuMessage: _apply_close_menu,
+    KeyPressMessage: _apply_key_press,
+    KeyHoldMessage: _apply_key_hold,
+    SetAspectRatioModeMessage: _apply_aspect_ratio_mode,
+    MacAddressMessage: _apply_mac_address,
+    TemperaturesMessage: _apply_temperatures,
+    IncomingSignalInfoMessage: _apply_incoming_signal,
+    OutgoingSignalInfoMessage: _apply_outgoing_signal,
+    AspectRatioMessage: _apply_aspect_ratio,
+    MaskingRatioMessage: _apply_masking_ratio,
+    ActiveProfileMessage: _apply_active_profile,
+    ActivateProfileMessage: _apply_active_profile,
+    CreateProfileGroupMessage: _apply_profile_group,
+    RenameProfileGroupMessage: _apply_profile_group,
+    ProfileGroupMessage: _apply_profile_group,
+    DeleteProfileGroupMessage: _apply_delete_profile_group,
+    CreateProfileMessage: _apply_profile_change,
+    RenameProfileMessage: _apply_profile_change,
+    ProfileMessage: _apply_profile,
+    DeleteProfileMessage: _apply_delete_profile,
+    SettingPageMessage: _apply_setting_page,
+    ConfigPageMessage: _apply_config_page,
+    OptionMessage: _apply_option,
+    ChangeOptionMessage: _apply_change_option,
+    InheritOptionMessage: _apply_inherit_option,
+    ResetTemporaryMessage: _apply_reset_temporary,
+    Upload3DLUTFileMessage: _apply_upload_3dlut,
+    Rename3DLUTFileMessage: _apply_rename_3dlut,
+    Delete3DLUTFileMessage: _apply_delete_3dlut,
+    UploadSettingsFileMessage: _apply_upload_settings,
+    StoreSettingsMessage: _apply_store_settings,
+    RestoreSettingsMessage: _apply_restore_settings,
+    ToggleMessage: _apply_toggle,
+    ToneMapOnMessage: _apply_tone_map_on,
+    ToneMapOffMessage: _apply_tone_map_off,
+    DisplayChangedMessage: _apply_display_changed,
+    RefreshLicenseInfoMessage: _system_action("RefreshLicenseInfo"),
+    Force1080p60OutputMessage: _system_action("Force1080p60Output"),
+    HotplugMessage: _system_action("Hotplug"),
+    FirmwareUpdateMessage: _apply_firmware_update,
+    MissingHeartbeatMessage: _apply_missing_heartbeat,
+    AddProfileToPageMessage: _system_action("AddProfileToPageMessage"),
+    RemoveProfileFromPageMessage: _system_action("RemoveProfileFromPageMessage"),
+}
+_UNRESOLVED = object()
+
+
+def _resolve_apply_handler(message_type: type[Message]) -> _ApplyHandler | None:
+    for base in message_type.__mro__[1:]:
+        handler = _APPLY_HANDLERS.get(base)
+        if handler is not None:
+            return handler
+    return None
+
+
+def _fields_written_by(message_type: type[Message]) -> tuple[str, ...] | None:
+    """Return the state fields ``apply`` writes for ``message_type``, or ``None`` when that is not tracked."""
+    written = _MESSAGE_FIELDS.get(message_type)
+    if written is not None:
+        return written
+    handler = _APPLY_HANDLERS.get(message_type, _UNRESOLVED)
+    if handler is _UNRESOLVED:
+        handler = _APPLY_HANDLERS[message_type] = _resolve_apply_handler(message_type)
+    return () if handler is None else None
@@ -3,26 +3,43 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
+from functools import lru_cache
 
 from madvr_envy import exceptions
 
 
+@lru_cache(maxsize=256)
+def _encode_line(line: str, encoding: str) -> bytes:
+    """Terminate and encode one outgoing line; repeated command lines hit the cache."""
+    payload = line if line.endswith("\n") else f"{line}\r\n"
+    return payload.encode(encoding)
+
+
 class TcpTransport:
     """Async TCP transport for line-based protocol communication."""
 
     ENCODING = "utf-8"
+    READ_CHUNK_SIZE = 65536
+    # Same bound ``StreamReader.readline`` enforced by default, so a peer that never sends a
+    # newline cannot grow the read buffer without limit.
+    MAX_LINE_LENGTH = 65536
 
     def __init__(self, host: str, port: int) -> None:
         self.host = host
         self.port = port
         self._reader: asyncio.StreamReader | None = None
         self._writer: asyncio.StreamWriter | None = None
+        self._read_buffer = bytearray()
+        self._lines: deque[str] = deque()
+        self._at_eof = False
 
     @property
     def connected(self) -> bool:
         return self._reader is not None and self._writer is not None
 
     async def connect(self, timeout: float | None) -> None:
+        self._reset_read_buffer()
         try:
             if timeout is None:
                 self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
@@ -39,6 +56,7 @@ class TcpTransport:
         writer = self._writer
         self._reader = None
         self._writer = None
+        self._reset_read_buffer()
         if writer is None:
             return
         writer.close()
@@ -48,22 +66,58 @@ class TcpTransport:
         if self._reader is None:
             raise exceptions.NotConnectedError()
 
-        if timeout is None:
-            line = await self._reader.readline()
-        else:
-            line = await asyncio.wait_for(self._reader.readline(), timeout=timeout)
-
-        if line == b"":
-            raise exceptions.NotConnectedError("Connection closed by peer.")
-
-        return line.decode(self.ENCODING, errors="replace").rstrip("\r\n")
+        if not self._lines:
+            if timeout is None:
+                await self._fill_lines(self._reader)
+            else:
+                await asyncio.wait_for(self._fill_lines(self._reader), timeout=timeout)
+
+        return self._lines.popleft()
+
+    def read_available_lines(self) -> list[str]:
+        """Return every complete line already buffered, without waiting for more input."""
+        lines = list(self._lines)
+        self._lines.clear()
+        return lines
+
+    async def _fill_lines(self, reader: asyncio.StreamReader) -> None:
+        """Read chunks until at least one complete line is buffered."""
+        while not self._lines:
+            if self._at_eof:
+                raise exceptions.NotConnectedError("Connection closed by peer.")
+
+            buffer = self._read_buffer
+            if len(buffer) > self.MAX_LINE_LENGTH:
+                buffer.clear()
+                raise exceptions.NotConnectedError(f"Line exceeds {self.MAX_LINE_LENGTH} bytes.")
+
+            data = await reader.read(self.READ_CHUNK_SIZE)
+            if not data:
+                # Mirror ``readline`` at EOF: hand out a trailing partial line once, then fail.
+                self._at_eof = True
+                if buffer:
+                    self._lines.append(buffer.decode(self.ENCODING, errors="replace").rstrip("\r"))
+                    buffer.clear()
+                continue
+
+            buffer += data
+            end = buffer.rfind(b"\n")
+            if end < 0:
+                continue
+            complete = buffer[:end].decode(self.ENCODING, errors="replace")
+            del buffer[: end + 1]
+            self._lines.extend(line.rstrip("\r") for line in complete.split("\n"))
+
+    def _reset_read_buffer(self) -> None:
+        self._read_buffer.clear()
+        self._lines.clear()
+        self._at_eof = False
 
     async def send_line(self, line: str, timeout: float | None) -> None:
         if self._writer is None:
             raise exceptions.NotConnectedError()
 
-        payload = line if line.endswith("\n") else f"{line}\r\n"
-        self._writer.write(payload.encode(self.ENCODING))
+        self._writer.write(_encode_line(line, self.ENCODING))
 
         try:
             if timeout is None:
@@ -1,4 +1,8 @@
-from madvr_envy.adapter import EnvyStateAdapter, snapshot_from_state
+import sys
+from dataclasses import fields, replace
+
+from madvr_envy import adapter as adapter_module
+from madvr_envy.adapter import EnvySnapshot, EnvyStateAdapter, snapshot_from_state
 from madvr_envy.protocol import (
     AspectRatioMessage,
     ChangeOptionMessage,
@@ -6,6 +10,8 @@ from madvr_envy.protocol import (
     IncomingSignalInfoMessage,
     KeyPressMessage,
     MaskingRatioMessage,
+    OkMessage,
+    OptionMessage,
     OutgoingSignalInfoMessage,
     ResetTemporaryMessage,
     StoreSettingsMessage,
@@ -46,6 +52,8 @@ def test_snapshot_from_state_is_immutable_and_comparable():
     assert snap.incoming_signal is not None
     assert snap.incoming_signal[0] == "3840x2160"
     assert snap.incoming_signal[8] == "16:9"
+    assert snap.incoming_signal.resolution == "3840x2160"
+    assert snap.incoming_signal.hdr_mode == "HDR10"
 
 
 def test_adapter_emits_deltas_and_events():
@@ -104,8 +112,98 @@ def test_adapter_emits_deltas_and_events():
     assert "outgoing_signal" in changed_fields
     assert "aspect_ratio" in changed_fields
     assert "masking_ratio" in changed_fields
+    assert all(delta.field is sys.intern(delta.field) for delta in deltas)
 
     assert "button" in event_kinds
     assert "temporary_reset" in event_kinds
     assert "display_changed" in event_kinds
     assert "settings_stored" in event_kinds
+
+
+def test_adapter_reuses_snapshot_when_state_revision_is_unchanged():
+    adapter = EnvyStateAdapter()
+    state = _base_state()
+
+    first_snapshot, _, _ = adapter.update(state)
+    state.apply(OkMessage())
+    second_snapshot, deltas, events = adapter.update(state)
+
+    assert second_snapshot is first_snapshot
+    assert deltas == []
+    assert events == []
+
+    state.apply(KeyPressMessage(button="MENU"))
+    third_snapshot, deltas, _ = adapter.update(state)
+
+    assert third_snapshot is not first_snapshot
+    assert [delta.field for delta in deltas] == ["last_button_event"]
+
+
+def test_adapter_sees_direct_field_assignments():
+    adapter = EnvyStateAdapter()
+    state = _base_state()
+    adapter.update(state)
+
+    state.version = "9.9"
+    snapshot, deltas, _ = adapter.update(state)
+    assert snapshot.version == "9.9"
+    assert [delta.field for delta in deltas] == ["version"]
+
+    state.current_menu = "Info"
+    state.apply(KeyPressMessage(button="UP"))
+    _, deltas, events = adapter.update(state)
+    assert [delta.field for delta in deltas] == ["current_menu", "last_button_event"]
+    assert [event.kind for event in events] == ["button"]
+
+
+def test_adapter_sees_in_place_container_mutations_after_touch():
+    adapter = EnvyStateAdapter()
+    state = _base_state()
+    adapter.update(state)
+
+    state.profiles["1_1"] = "Movies"
+    _, deltas, _ = adapter.update(state)
+    assert deltas == []
+
+    state.touch()
+    snapshot, deltas, _ = adapter.update(state)
+    assert snapshot.profiles == (("1_1", "Movies"),)
+    assert [delta.field for delta in deltas] == ["profiles"]
+
+
+def test_snapshot_accepts_plain_dict_containers():
+    option = OptionMessage(option_type="INTEGER", option_id="hdrNits", current_value=120, effective_value=121)
+    state = EnvyState(options={"hdrNits": option}, profiles={"2_1": "Sports", "1_1": "Movies"})
+    state.config_pages = {"b": "Second", "a": "First"}
+
+    snapshot = snapshot_from_state(state)
+
+    assert snapshot.options == (("hdrNits", "INTEGER", 120, 121),)
+    assert snapshot.profiles == (("1_1", "Movies"), ("2_1", "Sports"))
+    assert snapshot.config_pages == (("a", "First"), ("b", "Second"))
+
+
+def test_adapter_reuses_unchanged_sub_structures_across_snapshots():
+    adapter = EnvyStateAdapter()
+    state = _base_state()
+    state.apply(OptionMessage(option_type="INTEGER", option_id="hdrNits", current_value=120, effective_value=121))
+    state.apply(MaskingRatioMessage(resolution="3840:1700", decimal_ratio=2.259, integer_ratio=220))
+
+    first_snapshot, _, _ = adapter.update(state)
+    state.apply(KeyPressMessage(button="MENU"))
+    second_snapshot, _, _ = adapter.update(state)
+
+    assert second_snapshot.options is first_snapshot.options
+    assert second_snapshot.masking_ratio is first_snapshot.masking_ratio
+
+    unchanged = [field.name for field in fields(EnvySnapshot) if field.name != "last_button_event"]
+    assert all(getattr(second_snapshot, name) is getattr(first_snapshot, name) for name in unchanged)
+
+
+def test_adapter_diff_covers_every_snapshot_field():
+    base = snapshot_from_state(_base_state())
+
+    for field in fields(EnvySnapshot):
+        changed = replace(base, **{field.name: object()})
+        deltas = adapter_module._build_deltas(base, changed)
+        assert [(delta.field, delta.new) for delta in deltas] == [(field.name, getattr(changed, field.name))]
@@ -20,11 +20,12 @@ class FakeTransport:
         self.sent: list[str] = []
         self.connect_calls = 0
         self.close_calls = 0
-        self._incoming = asyncio.Queue()
+        self._incoming = deque(incoming_lines or [])
+        self._has_data = asyncio.Event()
         self._connect_exception = connect_exception
 
-        for line in incoming_lines or []:
-            self._incoming.put_nowait(line)
+        if self._incoming:
+            self._has_data.set()
 
     async def connect(self, timeout):
         self.connect_calls += 1
@@ -40,10 +41,10 @@ class FakeTransport:
         if not self.connected:
             raise NotConnectedError()
 
-        if timeout is None:
-            item = await self._incoming.get()
-        else:
-            item = await asyncio.wait_for(self._incoming.get(), timeout=timeout)
+        await asyncio.wait_for(self._has_data.wait(), timeout=timeout)
+        item = self._incoming.popleft()
+        if not self._incoming:
+            self._has_data.clear()
 
         if item is None:
             self.connected = False
@@ -57,7 +58,8 @@ class FakeTransport:
         self.sent.append(line)
 
     def push(self, line):
-        self._incoming.put_nowait(line)
+        self._incoming.append(line)
+        self._has_data.set()
 
 
 class CloseRaisesNotConnectedTransport(FakeTransport):
@@ -67,6 +69,19 @@ class CloseRaisesNotConnectedTransport(FakeTransport):
         raise NotConnectedError()
 
 
+class BufferedFakeTransport(FakeTransport):
+    def __init__(self, incoming_lines=None, connect_exception=None):
+        super().__init__(incoming_lines=incoming_lines, connect_exception=connect_exception)
+        self.drained: list[str] = []
+
+    def read_available_lines(self):
+        lines = list(self._incoming)
+        self._incoming.clear()
+        self._has_data.clear()
+        self.drained.extend(lines)
+        return lines
+
+
 class FakeTransportFactory:
     def __init__(self, transports):
         self._transports = deque(transports)
@@ -96,6 +111,27 @@ async def test_start_wait_synced_and_stop_are_idempotent():
     assert transport.close_calls == 1
 
 
+@pytest.mark.asyncio
+async def test_listen_loop_processes_buffered_lines_in_one_batch():
+    transport = BufferedFakeTransport(
+        incoming_lines=["WELCOME to Envy v1.1.3", "MacAddress 01-02-03-04-05-06", "ToneMapOn"],
+    )
+    client = MadvrEnvyClient(
+        host="unused",
+        transport_factory=FakeTransportFactory([transport]),
+        read_timeout=0.01,
+    )
+
+    await client.start()
+    await client.wait_synced(timeout=1)
+
+    assert transport.drained == ["MacAddress 01-02-03-04-05-06", "ToneMapOn"]
+    assert client.state.mac_address == "01-02-03-04-05-06"
+    assert client.state.tone_map_enabled is True
+
+    await client.stop()
+
+
 @pytest.mark.asyncio
 async def test_command_wait_for_ack_returns_ok_message():
     transport = FakeTransport(incoming_lines=["WELCOME to Envy v1.1.3"])
@@ -121,6 +157,61 @@ async def test_command_wait_for_ack_returns_ok_message():
     await client.stop()
 
 
+@pytest.mark.asyncio
+async def test_pipelined_commands_receive_acks_in_send_order():
+    transport = FakeTransport(incoming_lines=["WELCOME to Envy v1.1.3"])
+    client = MadvrEnvyClient(
+        host="unused",
+        transport_factory=FakeTransportFactory([transport]),
+        read_timeout=0.01,
+    )
+
+    await client.start()
+    await client.wait_synced(timeout=1)
+
+    first = asyncio.create_task(client.command("GetMacAddress", wait_for_ack=True, ack_timeout=0.5))
+    second = asyncio.create_task(client.command("Bogus", wait_for_ack=True, ack_timeout=0.5))
+    await asyncio.wait_for(_wait_for(lambda: len(client._ack_waiters) == 2), timeout=1)
+
+    transport.push("OK")
+    transport.push('ERROR "unknown command"')
+
+    assert await first is not None
+    with pytest.raises(CommandRejectedError):
+        await second
+    assert transport.sent[-2:] == ["GetMacAddress", "Bogus"]
+
+    await client.stop()
+
+
+@pytest.mark.asyncio
+async def test_command_ack_timeout_drops_abandoned_waiter():
+    transport = FakeTransport(incoming_lines=["WELCOME to Envy v1.1.3"])
+    client = MadvrEnvyClient(
+        host="unused",
+        transport_factory=FakeTransportFactory([transport]),
+        read_timeout=0.01,
+    )
+
+    await client.start()
+    await client.wait_synced(timeout=1)
+
+    with pytest.raises(TimeoutError):
+        await client.command("GetMacAddress", wait_for_ack=True, ack_timeout=0.01)
+
+    async def push_ack():
+        await asyncio.sleep(0)
+        transport.push("OK")
+
+    asyncio.create_task(push_ack())
+    ack = await client.command("GetTemperatures", wait_for_ack=True, ack_timeout=0.5)
+
+    assert ack is not None
+    assert not client._ack_waiters
+
+    await client.stop()
+
+
 @pytest.mark.asyncio
 async def test_typed_command_wrapper_sends_expected_payload():
     transport = FakeTransport(incoming_lines=["WELCOME to Envy v1.1.3"])
@@ -244,6 +335,134 @@ async def test_reconnect_uses_backoff_until_success():
     await client.stop()
 
 
+@pytest.mark.asyncio
+async def test_reconnect_jitter_adds_to_capped_backoff():
+    sleep_calls = []
+
+    async def fake_sleep(delay):
+        sleep_calls.append(delay)
+
+    first = FakeTransport(incoming_lines=["WELCOME to Envy v1.1.3", None])
+    failing = [FakeTransport(connect_exception=ConnectionFailedError("network down")) for _ in range(3)]
+    second = FakeTransport(incoming_lines=["WELCOME to Envy v1.1.4"])
+
+    client = MadvrEnvyClient(
+        host="unused",
+        transport_factory=FakeTransportFactory([first, *failing, second]),
+        read_timeout=0.01,
+        reconnect_initial_backoff=0.1,
+        reconnect_max_backoff=0.2,
+        reconnect_jitter=1.0,
+        sleep_func=fake_sleep,
+        random_func=lambda: 0.5,
+    )
+
+    await client.start()
+    await client.wait_synced(timeout=1)
+
+    await asyncio.wait_for(_wait_for(lambda: client.state.version == "1.1.4"), timeout=1)
+
+    assert sleep_calls == pytest.approx([0.15, 0.3, 0.3])
+
+    await client.stop()
+
+
+@pytest.mark.asyncio
+async def test_keepalive_sends_heartbeats_until_stopped():
+    transport = FakeTransport(incoming_lines=["WELCOME to Envy v1.1.3"])
+    tick = asyncio.Event()
+    sleep_calls: list[float] = []
+
+    async def fake_sleep(delay):
+        sleep_calls.append(delay)
+        await tick.wait()
+        tick.clear()
+
+    client = MadvrEnvyClient(
+        host="unused",
+        transport_factory=FakeTransportFactory([transport]),
+        read_timeout=0.01,
+        keepalive_interval=30.0,
+        sleep_func=fake_sleep,
+    )
+
+    await client.start()
+    await client.wait_synced(timeout=1)
+    for expected in (1, 2):
+        await asyncio.wait_for(_wait_for(lambda expected=expected: len(sleep_calls) == expected), timeout=1)
+        tick.set()
+        await asyncio.wait_for(_wait_for(lambda expected=expected: transport.sent.count("Heartbeat") == expected), timeout=1)
+        transport.push("OK")
+
+    await asyncio.wait_for(_wait_for(lambda: len(sleep_calls) == 3), timeout=1)
+    await client.stop()
+
+    assert sleep_calls == [30.0, 30.0, 30.0]
+    assert transport.sent == ["Heartbeat", "Heartbeat"]
+
+
+@pytest.mark.asyncio
+async def test_keepalive_heartbeat_ack_is_not_attributed_to_other_commands():
+    transport = FakeTransport(incoming_lines=["WELCOME to Envy v1.1.3"])
+    tick = asyncio.Event()
+
+    async def fake_sleep(delay):
+        await tick.wait()
+        tick.clear()
+
+    client = MadvrEnvyClient(
+        host="unused",
+        transport_factory=FakeTransportFactory([transport]),
+        read_timeout=0.01,
+        keepalive_interval=30.0,
+        sleep_func=fake_sleep,
+    )
+
+    await client.start()
+    await client.wait_synced(timeout=1)
+    tick.set()
+    await asyncio.wait_for(_wait_for(lambda: transport.sent == ["Heartbeat"]), timeout=1)
+
+    power_off = asyncio.create_task(client.power_off())
+    await asyncio.wait_for(_wait_for(lambda: transport.sent == ["Heartbeat", "PowerOff"]), timeout=1)
+    transport.push("OK")
+    transport.push('ERROR "not allowed"')
+
+    with pytest.raises(CommandRejectedError):
+        await asyncio.wait_for(power_off, timeout=1)
+
+    await client.stop()
+
+
+@pytest.mark.asyncio
+async def test_keepalive_stops_when_connection_closes_without_reconnect():
+    transport = FakeTransport(incoming_lines=["WELCOME to Envy v1.1.3"])
+    sleep_gate = asyncio.Event()
+
+    async def fake_sleep(delay):
+        await sleep_gate.wait()
+
+    client = MadvrEnvyClient(
+        host="unused",
+        transport_factory=FakeTransportFactory([transport]),
+        read_timeout=0.01,
+        auto_reconnect=False,
+        keepalive_interval=30.0,
+        sleep_func=fake_sleep,
+    )
+
+    await client.start()
+    await client.wait_synced(timeout=1)
+    transport.push(None)
+
+    await asyncio.wait_for(_wait_for(lambda: client._supervisor_task.done()), timeout=1)
+    await asyncio.wait_for(_wait_for(lambda: client._keepalive_task.done()), timeout=1)
+    assert client._keepalive_task.cancelled()
+    assert transport.sent == []
+
+    await client.stop()
+
+
 @pytest.mark.asyncio
 async def test_stop_swallows_not_connected_during_transport_close():
     transport = CloseRaisesNotConnectedTransport(incoming_lines=["WELCOME to Envy v1.1.3"])
@@ -322,6 +541,38 @@ async def test_enum_profile_groups_collect_returns_items_until_end_marker():
     await client.stop()
 
 
+@pytest.mark.asyncio
+async def test_concurrent_enum_collects_each_receive_items():
+    transport = FakeTransport(incoming_lines=["WELCOME to Envy v1.1.3"])
+    client = MadvrEnvyClient(
+        host="unused",
+        transport_factory=FakeTransportFactory([transport]),
+        read_timeout=0.01,
+    )
+
+    await client.start()
+    await client.wait_synced(timeout=1)
+
+    async def push_enumeration():
+        await asyncio.sleep(0)
+        transport.push("OK")
+        transport.push("OK")
+        transport.push('ProfileGroup displayProfiles "Displays"')
+        transport.push("ProfileGroup.")
+
+    asyncio.create_task(push_enumeration())
+    first, second = await asyncio.gather(
+        client.enum_profile_groups_collect(timeout=0.5),
+        client.enum_profile_groups_collect(timeout=0.5),
+    )
+
+    assert [group.group_id for group in first] == ["displayProfiles"]
+    assert [group.group_id for group in second] == ["displayProfiles"]
+    assert client._enum_sinks == {}
+
+    await client.stop()
+
+
 @pytest.mark.asyncio
 async def test_enum_options_collect_returns_typed_values():
     transport = FakeTransport(incoming_lines=["WELCOME to Envy v1.1.3"])
@@ -429,6 +680,143 @@ async def test_register_adapter_callback_emits_initial_and_change_events():
     await client.stop()
 
 
+@pytest.mark.asyncio
+async def test_register_adapter_callback_coalesces_message_bursts():
+    transport = FakeTransport(
+        incoming_lines=["WELCOME to Envy v1.1.3", "ToneMapOn", "OpenMenu Info", "SetAspectRatioMode Auto"]
+    )
+    client = MadvrEnvyClient(
+        host="unused",
+        transport_factory=FakeTransportFactory([transport]),
+        read_timeout=None,
+    )
+
+    emissions: list[tuple[object, list[object], list[object]]] = []
+
+    def on_adapter(snapshot, deltas, events):
+        emissions.append((snapshot, deltas, events))
+
+    client.register_adapter_callback(EnvyStateAdapter(), on_adapter)
+
+    await client.start()
+    await asyncio.wait_for(_wait_for(lambda: len(emissions) > 1), timeout=1)
+    await asyncio.sleep(0.01)
+
+    assert len(emissions) == 2
+    _, _, initial_events = emissions[0]
+    assert [event.kind for event in initial_events] == ["initial"]
+    snapshot, deltas, events = emissions[1]
+    assert snapshot.tone_map_enabled is True
+    assert snapshot.current_menu == "Info"
+    assert [delta.field for delta in deltas] == ["current_menu", "aspect_ratio_mode", "tone_map_enabled"]
+    assert events == []
+
+    await client.stop()
+
+
+@pytest.mark.asyncio
+async def test_register_adapter_callback_keeps_events_of_buffered_lines():
+    transport = BufferedFakeTransport(incoming_lines=["WELCOME to Envy v1.1.3", "KeyPress UP", "KeyPress DOWN", "ToneMapOn"])
+    client = MadvrEnvyClient(
+        host="unused",
+        transport_factory=FakeTransportFactory([transport]),
+        read_timeout=None,
+    )
+
+    button_events: list[object] = []
+
+    def on_adapter(snapshot, deltas, events):
+        button_events.extend(event.payload["button"] for event in events if event.kind == "button")
+
+    client.register_adapter_callback(EnvyStateAdapter(), on_adapter)
+
+    await client.start()
+    await asyncio.wait_for(_wait_for(lambda: client.state.tone_map_enabled is True), timeout=1)
+    await asyncio.sleep(0.01)
+
+    assert transport.drained == ["KeyPress UP", "KeyPress DOWN", "ToneMapOn"]
+    assert button_events == [("press", "UP"), ("press", "DOWN")]
+
+    await client.stop()
+
+
+@pytest.mark.asyncio
+async def test_failing_adapter_callback_does_not_block_plain_callbacks():
+    transport = FakeTransport(incoming_lines=["WELCOME to Envy v1.1.3", "ToneMapOn"])
+    client = MadvrEnvyClient(
+        host="unused",
+        transport_factory=FakeTransportFactory([transport]),
+        read_timeout=None,
+    )
+
+    received: list[object] = []
+
+    def on_adapter(snapshot, deltas, events):
+        raise RuntimeError("boom")
+
+    handle = client.register_adapter_callback(EnvyStateAdapter(), on_adapter)
+
+    def on_event(event, message):
+        if event == "received_message":
+            received.append(message)
+
+    client.register_callback(on_event)
+
+    await client.start()
+    await asyncio.wait_for(_wait_for(lambda: len(received) == 2), timeout=1)
+    await asyncio.sleep(0)
+
+    client.deregister_callback(handle)
+    assert client._adapter_callbacks == ()
+
+    await client.stop()
+
+
+@pytest.mark.asyncio
+async def test_failing_adapter_update_does_not_stop_the_listener():
+    class FailingAdapter(EnvyStateAdapter):
+        def update(self, state):
+            raise RuntimeError("boom")
+
+    transport = FakeTransport(incoming_lines=["WELCOME to Envy v1.1.3", "KeyPress MENU"])
+    client = MadvrEnvyClient(
+        host="unused",
+        transport_factory=FakeTransportFactory([transport]),
+        read_timeout=None,
+    )
+    client.register_adapter_callback(FailingAdapter(), lambda snapshot, deltas, events: None)
+
+    await client.start()
+    await asyncio.wait_for(_wait_for(lambda: client.state.last_button_event == ("press", "MENU")), timeout=1)
+
+    transport.push("ToneMapOn")
+    await asyncio.wait_for(_wait_for(lambda: client.state.tone_map_enabled is True), timeout=1)
+    assert not client._supervisor_task.done()
+
+    await client.stop()
+
+
+def test_callbacks_run_in_registration_order_and_may_deregister_while_emitting():
+    client = MadvrEnvyClient("127.0.0.1")
+    calls: list[str] = []
+
+    def first(event, message):
+        calls.append("first")
+        client.deregister_callback(first)
+
+    def second(event, message):
+        calls.append("second")
+
+    client.register_callback(first)
+    client.register_callback(second)
+    client.register_callback(first)
+
+    client._emit("connected", None)
+    client._emit("connected", None)
+
+    assert calls == ["first", "second", "second"]
+
+
 async def _wait_for(predicate):
     for _ in range(1000):
         if predicate():
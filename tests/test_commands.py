@@ -8,6 +8,8 @@ def test_basic_command_builders():
     assert commands.restart() == "Restart"
     assert commands.reload_software() == "ReloadSoftware"
     assert commands.bye() == "Bye"
+    assert commands.HEARTBEAT == "Heartbeat"
+    assert commands.heartbeat() is commands.HEARTBEAT
 
 
 def test_menu_and_key_commands():
@@ -15,6 +17,10 @@ def test_menu_and_key_commands():
     assert commands.close_menu() == "CloseMenu"
     assert commands.key_press("MENU") == "KeyPress MENU"
     assert commands.key_hold("DOWN") == "KeyHold DOWN"
+    assert commands.key_press("F1") == "KeyPress F1"
+    assert commands.open_menu("Custom Menu") == 'OpenMenu "Custom Menu"'
+    assert commands.set_aspect_ratio_mode("2.40:1") == "SetAspectRatioMode 2.40:1"
+    assert commands.set_aspect_ratio_mode("1.78:1") == "SetAspectRatioMode 1.78:1"
 
 
 def test_display_commands():
@@ -1,4 +1,9 @@
-from madvr_envy.adapter import AdapterEvent, StateDelta, snapshot_from_state
+from dataclasses import replace
+
+import pytest
+
+from madvr_envy import adapter as adapter_module
+from madvr_envy.adapter import AdapterEvent, EnvyStateAdapter, StateDelta, snapshot_from_state
 from madvr_envy.ha_bridge import HABridgeDispatcher, build_bridge_update, coordinator_payload, to_ha_events
 from madvr_envy.protocol import (
     AspectRatioMessage,
@@ -80,6 +85,24 @@ def test_coordinator_payload_contains_normalized_fields():
     assert payload["options"]["hdrNits"]["effective"] == 121
 
 
+@pytest.mark.parametrize(
+    ("is_on", "standby", "expected"),
+    [
+        (True, True, "on"),
+        (True, None, "on"),
+        (False, True, "standby"),
+        (None, True, "standby"),
+        (False, False, "off"),
+        (False, None, "off"),
+        (None, False, "unknown"),
+        (None, None, "unknown"),
+    ],
+)
+def test_coordinator_payload_power_state(is_on, standby, expected):
+    snapshot = replace(snapshot_from_state(EnvyState()), is_on=is_on, standby=standby)
+    assert coordinator_payload(snapshot)["power_state"] == expected
+
+
 def test_to_ha_events_maps_kinds_and_payloads():
     events = [
         AdapterEvent(kind="temporary_reset", payload={"count": 2, "increment": 1}),
@@ -91,6 +114,7 @@ def test_to_ha_events_maps_kinds_and_payloads():
     assert mapped[0].event_data["count"] == 2
     assert mapped[1].event_type == "madvr_envy.button"
     assert mapped[1].event_data["button"] == ("press", "UP")
+    assert to_ha_events(events)[0].event_type is mapped[0].event_type
 
 
 def test_build_bridge_update_collects_changed_fields_and_events():
@@ -105,6 +129,7 @@ def test_build_bridge_update_collects_changed_fields_and_events():
 
     assert update.coordinator_data["tone_map_enabled"] is True
     assert update.changed_fields == ("tone_map_enabled", "last_button_event")
+    assert update.changed_fields_set == frozenset({"tone_map_enabled", "last_button_event"})
     assert len(update.bus_events) == 1
     assert update.bus_events[0].event_type == "madvr_envy.button"
 
@@ -125,3 +150,93 @@ def test_dispatcher_handles_update_and_emits_events():
     assert dispatcher.last_update is not None
     assert update.changed_fields == ("last_button_event",)
     assert emitted == [("madvr_envy.button", {"button": ("press", "MENU")})]
+
+
+def test_dispatcher_patches_payload_from_adapter_deltas():
+    state = EnvyState()
+    adapter = EnvyStateAdapter()
+    dispatcher = HABridgeDispatcher()
+    dispatcher.handle_adapter_update(*adapter.update(state))
+
+    for message in (
+        WelcomeMessage(version="1.1.3"),
+        ToneMapOnMessage(),
+        KeyPressMessage(button="MENU"),
+        ChangeOptionMessage(option_type="INTEGER", option_id_path="hdrNits", current_value=120, effective_value=121),
+    ):
+        state.apply(message)
+        snapshot, deltas, events = adapter.update(state)
+        update = dispatcher.handle_adapter_update(snapshot, deltas, events)
+        assert update.coordinator_data == coordinator_payload(snapshot)
+
+    previous = snapshot_from_state(EnvyState())
+    current = snapshot_from_state(_state_for_bridge())
+    first = HABridgeDispatcher()
+    first.handle_adapter_update(previous, [], [])
+    update = first.handle_adapter_update(current, adapter_module._build_deltas(previous, current), [])
+    assert update.coordinator_data == coordinator_payload(current)
+
+
+def test_dispatcher_reuses_one_update_for_idle_ticks():
+    state = EnvyState()
+    adapter = EnvyStateAdapter()
+    dispatcher = HABridgeDispatcher()
+    dispatcher.handle_adapter_update(*adapter.update(state))
+    state.apply(WelcomeMessage(version="1.1.3"))
+    changed = dispatcher.handle_adapter_update(*adapter.update(state))
+
+    idle = dispatcher.handle_adapter_update(*adapter.update(state))
+    assert idle.changed_fields == ()
+    assert idle.bus_events == ()
+    assert idle.coordinator_data == changed.coordinator_data
+    assert dispatcher.handle_adapter_update(*adapter.update(state)) is idle
+    assert dispatcher.last_update is idle
+
+
+def test_dispatcher_payloads_are_isolated_from_top_level_mutations():
+    state = _state_for_bridge()
+    adapter = EnvyStateAdapter()
+    dispatcher = HABridgeDispatcher()
+    first = dispatcher.handle_adapter_update(*adapter.update(state))
+    first.coordinator_data["version"] = "mutated"
+    del first.coordinator_data["profiles"]
+
+    state.apply(KeyPressMessage(button="UP"))
+    changed = dispatcher.handle_adapter_update(*adapter.update(state))
+    assert changed.coordinator_data == coordinator_payload(adapter.last_snapshot)
+    assert changed.coordinator_data["options"] is first.coordinator_data["options"]
+
+
+def test_dispatcher_rebuilds_payload_for_a_new_adapter():
+    dispatcher = HABridgeDispatcher()
+    old_adapter = EnvyStateAdapter()
+    dispatcher.handle_adapter_update(*old_adapter.update(_state_for_bridge()))
+
+    new_adapter = EnvyStateAdapter()
+    snapshot, deltas, events = new_adapter.update(EnvyState())
+    update = dispatcher.handle_adapter_update(snapshot, deltas, [AdapterEvent(kind="initial", payload={}), *events])
+    assert update.coordinator_data == coordinator_payload(snapshot)
+
+
+def test_dispatcher_batch_emitter_receives_all_events_in_one_call():
+    snapshot = snapshot_from_state(_state_for_bridge())
+    events = [
+        AdapterEvent(kind="button", payload={"button": ("press", "MENU")}),
+        AdapterEvent(kind="display_changed", payload={"count": 1, "increment": 1}),
+    ]
+    batches: list[list[tuple[str, dict[str, object]]]] = []
+    single: list[str] = []
+
+    dispatcher = HABridgeDispatcher(
+        event_emitter=lambda event_type, _: single.append(event_type), batch_emitter=batches.append
+    )
+    dispatcher.handle_adapter_update(snapshot, [], events)
+    dispatcher.handle_adapter_update(snapshot, [], [])
+
+    assert batches == [
+        [
+            ("madvr_envy.button", {"button": ("press", "MENU")}),
+            ("madvr_envy.display_changed", {"count": 1, "increment": 1}),
+        ]
+    ]
+    assert single == []
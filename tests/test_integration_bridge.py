@@ -5,6 +5,8 @@ from types import SimpleNamespace
 import pytest
 
 from madvr_envy.integration_bridge import (
+    EnvyAction,
+    RemoteOperation,
     action_names,
     build_profile_options,
     iter_remote_operations,
@@ -35,11 +37,17 @@ def test_normalize_action_and_resolve_method():
     client = SimpleNamespace(restart=restart)
     method = resolve_action_method(client, " Restart ")
     assert method is restart
+    assert resolve_action_method(client, EnvyAction.RESTART) is restart
+    assert resolve_action_method(client, "restart") is restart
+    assert normalize_action("restart") is EnvyAction.RESTART
+    assert normalize_action(" Tone_Map_On ") is EnvyAction.TONE_MAP_ON
 
 
 def test_normalize_action_invalid():
     with pytest.raises(ValueError):
         normalize_action("unknown_action")
+    with pytest.raises(ValueError):
+        resolve_action_method(SimpleNamespace(), "unknown_action")
 
 
 def test_iter_remote_operations():
@@ -48,6 +56,8 @@ def test_iter_remote_operations():
         ("key", "MENU"),
         ("action", "restart"),
     ]
+    assert iter_remote_operations(" action: standby ") == (RemoteOperation(kind="action", value="standby"),)
+    assert iter_remote_operations(iter(["actions:x"])) == (RemoteOperation(kind="key", value="actions:x"),)
 
 
 def test_parse_profile_id():
@@ -55,6 +65,10 @@ def test_parse_profile_id():
     assert parse_profile_id("source:5", None) == ("source", 5)
     assert parse_profile_id("7", "fallback") == ("fallback", 7)
     assert parse_profile_id("bad-value", "fallback") is None
+    assert parse_profile_id("group_name_3", None) == ("group_name", 3)
+    assert parse_profile_id("a_1:2", None) == ("a_1", 2)
+    assert parse_profile_id("_4", None) is None
+    assert parse_profile_id("source_4x", None) is None
 
 
 def test_build_profile_options():
@@ -74,3 +88,9 @@ def test_build_profile_options():
         ("1", 2),
         ("2", 1),
     ]
+
+
+def test_build_profile_options_keeps_input_order_for_case_insensitive_ties():
+    data = {"profiles": {"1_2": "day", "1_1": "Day", "1_3": "DAY"}}
+    options = build_profile_options(data)
+    assert [option.profile_index for option in options] == [2, 1, 3]
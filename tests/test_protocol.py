@@ -38,6 +38,7 @@ from madvr_envy.protocol import (
     WelcomeMessage,
     build_command,
     parse_message,
+    parse_messages,
 )
 
 
@@ -52,12 +53,17 @@ def test_parse_ok_and_error_messages():
     error = parse_message('ERROR "invalid command"')
     assert isinstance(error, ErrorMessage)
     assert error.error == "invalid command"
+    assert parse_message("OK").is_ack is True
+    assert error.is_ack is True
+    assert parse_message("Standby").is_ack is False
 
 
 def test_parse_state_notifications():
     assert isinstance(parse_message("Standby"), StandbyMessage)
     assert isinstance(parse_message("PowerOff"), PowerOffMessage)
     assert isinstance(parse_message("NoSignal"), NoSignalMessage)
+    assert parse_message("Standby") is parse_message("Standby x" * 40)
+    assert not hasattr(parse_message("Standby"), "__dict__")
 
 
 def test_parse_incoming_and_outgoing_signal():
@@ -71,6 +77,44 @@ def test_parse_incoming_and_outgoing_signal():
     assert outgoing.hdr_mode == "SDR"
 
 
+def test_parse_signal_info_interns_repeated_tokens():
+    first = parse_message("IncomingSignalInfo 3840x2160 23.976p 2D 422 10bit HDR10 2020 TV 16:9")
+    second = parse_message("IncomingSignalInfo 3840x2160 24p 2D 422 10bit HDR10 2020 TV 16:9")
+    assert isinstance(first, IncomingSignalInfoMessage)
+    assert isinstance(second, IncomingSignalInfoMessage)
+    assert first.resolution is second.resolution
+    assert first.hdr_mode is second.hdr_mode
+    assert first.aspect_ratio is second.aspect_ratio
+
+
+def test_parse_option_interns_type_and_id():
+    first = parse_message("Option INTEGER hdrNits 120 120")
+    second = parse_message("ChangeOption INTEGER hdrNits 130 130")
+    assert isinstance(first, OptionMessage)
+    assert isinstance(second, ChangeOptionMessage)
+    assert first.option_type is second.option_type
+    assert first.option_id is second.option_id_path
+
+
+def test_parse_message_reuses_results_for_repeated_short_lines():
+    line = "Temperatures 74 67 41 45"
+    assert parse_message(line) is parse_message("".join(["Temperatures", " 74 67 41 45"]))
+
+    long_line = "Option STRING longOption " + '"' + "x" * 300 + '" "y"'
+    assert parse_message(long_line) is not parse_message(long_line)
+    assert parse_message(long_line) == parse_message(long_line)
+
+
+def test_parse_messages_parses_each_non_blank_line():
+    messages = parse_messages(b"OK\r\n\r\nKeyPress MENU\r\nStandby")
+    assert messages == [OkMessage(), KeyPressMessage(button="MENU"), StandbyMessage()]
+    assert parse_messages("") == []
+
+
+def test_parse_messages_drops_crlf_from_unknown_lines():
+    assert parse_messages("bogus line\r\nOK\r\n") == [UnknownMessage("bogus line"), OkMessage()]
+
+
 def test_parse_aspect_and_masking_ratio():
     aspect = parse_message('AspectRatio 3840:1600 2.400 240 "Panavision 70"')
     assert isinstance(aspect, AspectRatioMessage)
@@ -109,6 +153,7 @@ def test_parse_profile_and_page_enumeration_messages():
     assert isinstance(config_page, ConfigPageMessage)
     assert config_page.page_id == "displayConfig"
     assert isinstance(parse_message("ConfigPage."), ConfigPageEndMessage)
+    assert parse_message("ConfigPage.") is parse_message(" ConfigPage.")
 
 
 def test_parse_option_messages():
@@ -117,6 +162,7 @@ def test_parse_option_messages():
     assert option.option_id == "hdrMode"
     assert option.current_value == "toneMapMath"
     assert isinstance(parse_message("Option."), OptionEndMessage)
+    assert parse_message("Option.") is parse_message(" Option.")
 
     changed = parse_message("ChangeOption INTEGER hdrHighlightRecovery 2 3")
     assert isinstance(changed, ChangeOptionMessage)
@@ -202,6 +248,10 @@ def test_parser_returns_unknown_for_unhandled_lines():
     message = parse_message("UnrecognizedMessage 123")
     assert isinstance(message, UnknownMessage)
     assert message.raw.startswith("UnrecognizedMessage")
+    assert parse_message("WELCOME back ") == UnknownMessage("WELCOME back ")
+    assert parse_message("Toggle a b ") == UnknownMessage("Toggle a b ")
+    assert parse_message('ProfileGroupX 1 "Cinema"') == UnknownMessage('ProfileGroupX 1 "Cinema"')
+    assert parse_message("Options.") == UnknownMessage("Options.")
 
 
 def test_build_command_quotes_only_when_needed():
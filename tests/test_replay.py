@@ -1,21 +1,32 @@
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
-from madvr_envy.protocol import UnknownMessage, parse_message
+import pytest
+
+from madvr_envy import adapter as adapter_module
+from madvr_envy.adapter import EnvyStateAdapter
+from madvr_envy.protocol import Message, UnknownMessage, parse_message, parse_messages
 from madvr_envy.state import EnvyState
 
 
+def _parse_lines(lines: Iterable[str], unknown_lines: list[str]) -> Iterator[Message]:
+    for raw_line in lines:
+        line = raw_line.strip()
+        if not line:
+            continue
+        message = parse_message(line)
+        if isinstance(message, UnknownMessage):
+            unknown_lines.append(line)
+        yield message
+
+
 def _replay_fixture(name: str) -> tuple[EnvyState, list[str]]:
     fixture = Path(__file__).parent / "fixtures" / name
-    lines = [line.strip() for line in fixture.read_text().splitlines() if line.strip()]
-
     state = EnvyState()
     unknown_lines: list[str] = []
 
-    for line in lines:
-        message = parse_message(line)
-        if isinstance(message, UnknownMessage):
-            unknown_lines.append(line)
-        state.apply(message)
+    with fixture.open(encoding="utf-8") as lines:
+        state.apply_many(_parse_lines(lines, unknown_lines))
 
     return state, unknown_lines
 
@@ -72,3 +83,20 @@ def test_session_settings_churn_replay_converges_state():
     assert state.tone_map_enabled is False
     assert state.last_store_settings == ("1", "Slot 1 Fancy Name")
     assert state.last_restore_settings == "1"
+
+
+@pytest.mark.parametrize(
+    "fixture_name",
+    ["session_bootstrap.log", "session_standby_wake.log", "session_settings_churn.log"],
+)
+def test_replay_incremental_deltas_match_full_snapshot_diff(fixture_name: str):
+    fixture = Path(__file__).parent / "fixtures" / fixture_name
+    adapter = EnvyStateAdapter()
+    state = EnvyState()
+    previous, _, _ = adapter.update(state)
+
+    for message in parse_messages(fixture.read_bytes()):
+        state.apply(message)
+        snapshot, deltas, events = adapter.update(state)
+        assert (deltas, events) == adapter_module._build_changes(previous, snapshot)
+        previous = snapshot
@@ -1,5 +1,11 @@
+from dataclasses import dataclass, fields
+from typing import get_type_hints
+
+import pytest
+
 from madvr_envy.protocol import (
     ActiveProfileMessage,
+    AddProfileToPageMessage,
     AspectRatioMessage,
     ChangeOptionMessage,
     ConfigPageMessage,
@@ -10,9 +16,11 @@ from madvr_envy.protocol import (
     KeyPressMessage,
     MacAddressMessage,
     NoSignalMessage,
+    OkMessage,
     OpenMenuMessage,
     OptionMessage,
     PowerOffMessage,
+    RemoveProfileFromPageMessage,
     Rename3DLUTFileMessage,
     RestoreSettingsMessage,
     SettingPageMessage,
@@ -23,7 +31,7 @@ from madvr_envy.protocol import (
     UploadSettingsFileMessage,
     WelcomeMessage,
 )
-from madvr_envy.state import EnvyState
+from madvr_envy.state import _APPLY_HANDLERS, EnvyState
 
 
 def test_state_sync_and_runtime_values():
@@ -132,3 +140,163 @@ def test_extended_state_updates():
 
     state.apply(RestoreSettingsMessage(target="Suggested"))
     assert state.last_restore_settings == "Suggested"
+
+
+def test_revision_tracks_state_changes():
+    state = EnvyState()
+    revision = state.revision
+
+    state.apply(OkMessage())
+    assert state.revision == revision
+
+    state.apply(WelcomeMessage(version="1.1.3"))
+    assert state.revision > revision
+
+    revision = state.revision
+    state.reset_runtime_values()
+    assert state.revision > revision
+
+
+def test_reset_runtime_values_restores_field_defaults():
+    state = EnvyState()
+    state.apply(WelcomeMessage(version="1.1.3"))
+    state.apply(SettingPageMessage(page_id="a", name="A"))
+    state.apply(UploadSettingsFileMessage())
+    state.apply(FirmwareUpdateMessage())
+    settings_pages = state.settings_pages
+    assert settings_pages.sorted_items() == (("a", "A"),)
+
+    state.reset_runtime_values()
+
+    assert state == EnvyState()
+    assert state.synced is False
+    assert state.settings_pages is settings_pages
+    assert settings_pages.sorted_items() == ()
+
+
+def test_changed_fields_since_reports_fields_written_after_revision():
+    state = EnvyState()
+    state.apply(WelcomeMessage(version="1.1.3"))
+    revision = state.revision
+
+    state.apply(SettingPageMessage(page_id="a", name="A"))
+    state.apply(OkMessage())
+    assert state.changed_fields_since(revision) == {"settings_pages"}
+    assert state.changed_fields_since(state.revision) == set()
+
+    state.reset_runtime_values()
+    assert state.changed_fields_since(revision) is None
+    assert state.changed_fields_since(state.revision) == set()
+
+
+_SAMPLE_VALUES = {str: "1", int: 1, float: 1.5, tuple[int, ...]: (1, 2)}
+
+
+def _sample_message(message_type):
+    hints = get_type_hints(message_type)
+    return message_type(
+        **{
+            message_field.name: _SAMPLE_VALUES.get(hints[message_field.name], 1)
+            for message_field in fields(message_type)
+            if message_field.init
+        }
+    )
+
+
+def _field_values(state):
+    return {
+        state_field.name: dict(value) if isinstance(value, dict) else value
+        for state_field in fields(state)
+        if not state_field.name.startswith("_")
+        for value in (getattr(state, state_field.name),)
+    }
+
+
+def test_changed_fields_since_covers_every_field_each_message_writes():
+    state = EnvyState()
+    for _ in range(2):
+        for message_type, handler in list(_APPLY_HANDLERS.items()):
+            if handler is None:
+                continue
+            before = _field_values(state)
+            revision = state.revision
+            state.apply(_sample_message(message_type))
+            after = _field_values(state)
+
+            written = {name for name, value in after.items() if value != before[name]}
+            assert written <= state.changed_fields_since(revision), message_type.__name__
+
+
+def test_profile_page_links_record_system_action():
+    state = EnvyState()
+    state.apply(AddProfileToPageMessage(profile_id="SOURCE_1", page_id="hdr"))
+    assert state.last_system_action == "AddProfileToPageMessage"
+    state.apply(RemoveProfileFromPageMessage(profile_id="SOURCE_1", page_id="hdr"))
+    assert state.last_system_action == "RemoveProfileFromPageMessage"
+
+
+def test_repeated_change_option_keeps_stored_option():
+    state = EnvyState()
+    change = ChangeOptionMessage(option_type="INTEGER", option_id_path="hdrNits", current_value=121, effective_value=121)
+    state.apply(change)
+    stored = state.options["hdrNits"]
+    items = state.options.sorted_items()
+
+    state.apply(ChangeOptionMessage(option_type="INTEGER", option_id_path="hdrNits", current_value=121, effective_value=121))
+    assert state.options["hdrNits"] is stored
+    assert state.options.sorted_items() is items
+
+    state.apply(ChangeOptionMessage(option_type="INTEGER", option_id_path="hdrNits", current_value=130, effective_value=130))
+    assert state.options["hdrNits"].current_value == 130
+
+
+def test_apply_many_matches_applying_each_message():
+    messages = [
+        WelcomeMessage(version="1.1.3"),
+        SettingPageMessage(page_id="a", name="A"),
+        OkMessage(),
+        UploadSettingsFileMessage(),
+        PowerOffMessage(),
+    ]
+    one_by_one = EnvyState()
+    for message in messages:
+        one_by_one.apply(message)
+
+    batched = EnvyState()
+    batched.apply_many(messages)
+
+    assert batched == one_by_one
+    assert batched.revision == one_by_one.revision
+    assert batched.changed_fields_since(1) == one_by_one.changed_fields_since(1)
+
+
+def test_apply_dispatches_message_subclasses_to_their_base_handler():
+    @dataclass(frozen=True, slots=True)
+    class VendorKeyPressMessage(KeyPressMessage):
+        pass
+
+    state = EnvyState()
+    revision = state.revision
+    state.apply(VendorKeyPressMessage(button="MENU"))
+
+    assert state.last_button_event == ("press", "MENU")
+    assert state.changed_fields_since(revision) is None
+
+
+def test_sorted_items_are_memoized_until_mutation():
+    state = EnvyState()
+    state.apply(SettingPageMessage(page_id="b", name="B"))
+    state.apply(SettingPageMessage(page_id="a", name="A"))
+
+    items = state.settings_pages.sorted_items()
+    assert items == (("a", "A"), ("b", "B"))
+    assert state.settings_pages.sorted_items() is items
+
+    state.settings_pages.pop("a")
+    assert state.settings_pages.sorted_items() == (("b", "B"),)
+
+
+@pytest.mark.parametrize("name", ["synced", "_revision"])
+def test_derived_fields_are_not_init_arguments(name):
+    with pytest.raises(TypeError):
+        EnvyState(**{name: 1})
@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+
+from madvr_envy.exceptions import NotConnectedError
+from madvr_envy.transport import TcpTransport
+
+
+async def _serve(payload: bytes) -> tuple[asyncio.Server, int]:
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        writer.write(payload)
+        await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    return server, server.sockets[0].getsockname()[1]
+
+
+@pytest.mark.asyncio
+async def test_read_line_splits_buffered_chunks_into_lines():
+    server, port = await _serve(b"WELCOME to Envy v1.1.3\r\nOK\r\nIncomingSignalInfo 3840x2160\r\nPowerOff")
+    transport = TcpTransport("127.0.0.1", port)
+
+    async with server:
+        await transport.connect(timeout=1)
+        lines = [await transport.read_line(timeout=1) for _ in range(4)]
+        with pytest.raises(NotConnectedError):
+            await transport.read_line(timeout=1)
+        await transport.close()
+
+    assert lines == ["WELCOME to Envy v1.1.3", "OK", "IncomingSignalInfo 3840x2160", "PowerOff"]
+
+
+@pytest.mark.asyncio
+async def test_read_line_reassembles_lines_split_across_reads():
+    transport = TcpTransport("127.0.0.1", 0)
+    reader = asyncio.StreamReader()
+    transport._reader = reader
+    transport._writer = object()  # type: ignore[assignment]
+
+    reader.feed_data(b"Temperatures 74 ")
+    pending = asyncio.create_task(transport.read_line(timeout=1))
+    await asyncio.sleep(0)
+    assert not pending.done()
+
+    reader.feed_data(b"60 50 40\r\nOK\r\nStandby\r\nNoSig")
+    assert await pending == "Temperatures 74 60 50 40"
+    assert transport.read_available_lines() == ["OK", "Standby"]
+    assert transport.read_available_lines() == []
+
+
+@pytest.mark.asyncio
+async def test_read_line_rejects_lines_over_the_length_limit():
+    transport = TcpTransport("127.0.0.1", 0)
+    transport.MAX_LINE_LENGTH = 16
+    reader = asyncio.StreamReader()
+    transport._reader = reader
+    transport._writer = object()  # type: ignore[assignment]
+
+    reader.feed_data(b"OK\r\n" + b"x" * 20)
+    assert await transport.read_line(timeout=1) == "OK"
+    with pytest.raises(NotConnectedError):
+        await transport.read_line(timeout=1)
+    assert transport._read_buffer == bytearray()
+
+
+@pytest.mark.asyncio
+async def test_send_line_terminates_and_encodes_lines():
+    received = asyncio.get_running_loop().create_future()
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        received.set_result(await reader.readexactly(len(b"Heartbeat\r\nHeartbeat\r\nBye\n")))
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    transport = TcpTransport("127.0.0.1", server.sockets[0].getsockname()[1])
+
+    async with server:
+        await transport.connect(timeout=1)
+        await transport.send_line("Heartbeat", timeout=1)
+        await transport.send_line("Heartbeat", timeout=1)
+        await transport.send_line("Bye\n", timeout=1)
+        assert await asyncio.wait_for(received, timeout=1) == b"Heartbeat\r\nHeartbeat\r\nBye\n"
+        await transport.close()